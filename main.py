@@ -18,32 +18,48 @@ Examples:
 from __future__ import annotations
 
 import argparse
-import asyncio
-import json
 import logging
 import os
 import signal
 import sys
+import threading
 
-from dotenv import load_dotenv
+from src.shutdown import SHUTDOWN_EVENT
 
-# Load environment variables before any LLM imports
-load_dotenv()
+DEFAULT_OUTPUT_DIR = "audit/report_onself_generated"
 
 
 # ---------------------------------------------------------------------------
-# SIGINT handler — forcefully terminate even when threads are blocked on I/O.
-# sys.exit() only raises SystemExit which background threads can ignore;
-# os._exit() kills the process at the OS level immediately.
+# SIGINT handler — cooperative first, forceful second.
+# The first Ctrl+C sets SHUTDOWN_EVENT so nodes stop scheduling new work and
+# run their clean-up (temporary clones); after a short grace period, or on a
+# second Ctrl+C, os._exit() kills the process at the OS level — sys.exit()
+# only raises SystemExit, which threads blocked on I/O can ignore.
 # ---------------------------------------------------------------------------
+SHUTDOWN_GRACE_SECONDS = 2.0
+
+
+def _force_exit() -> None:
+    os._exit(130)  # 128 + SIGINT(2) = 130
+
+
 def _sigint_handler(signum, frame):
-    """Handle Ctrl+C by forcefully killing the process."""
+    """Handle Ctrl+C: request cooperative shutdown, force-kill on repeat."""
+    if SHUTDOWN_EVENT.is_set():
+        print("\nSecond interrupt received. Force-killing process...", file=sys.stderr)
+        _force_exit()
+
+    SHUTDOWN_EVENT.set()
     print("\n" + "!" * 60, file=sys.stderr)
     print(
-        "AUDIT INTERRUPTED BY USER (Ctrl+C). Force-killing process...", file=sys.stderr
+        "AUDIT INTERRUPTED BY USER (Ctrl+C). Cleaning up "
+        f"(force-kill in {SHUTDOWN_GRACE_SECONDS:.0f}s, Ctrl+C again to kill now)...",
+        file=sys.stderr,
     )
     print("!" * 60, file=sys.stderr)
-    os._exit(130)  # 128 + SIGINT(2) = 130
+    timer = threading.Timer(SHUTDOWN_GRACE_SECONDS, _force_exit)
+    timer.daemon = True
+    timer.start()
 
 
 signal.signal(signal.SIGINT, _sigint_handler)
@@ -57,10 +73,21 @@ def setup_logging(verbose: bool = False) -> None:
         format="%(asctime)s │ %(name)-30s │ %(levelname)-7s │ %(message)s",
         datefmt="%H:%M:%S",
     )
-    # Reduce noise from HTTP libraries
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    _configure_noisy_loggers()
+
+
+# HTTP client libraries that log every request at INFO/DEBUG
+NOISY_LOGGERS = ("httpx", "httpcore", "urllib3")
+
+
+def _configure_noisy_loggers() -> None:
+    """Reduce noise from HTTP libraries.
+
+    Needed at the default INFO level too: httpx logs one INFO line per
+    LLM request.
+    """
+    for name in NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
 
 
 def main() -> None:
@@ -89,14 +116,17 @@ def main() -> None:
     parser.add_argument(
         "--output-dir",
         dest="output_dir",
-        default=os.getenv("OUTPUT_DIR", "audit/report_onself_generated"),
-        help="Directory for the generated audit report",
+        default=None,
+        help=(
+            "Directory for the generated audit report "
+            f"(default: $OUTPUT_DIR or {DEFAULT_OUTPUT_DIR})"
+        ),
     )
     parser.add_argument(
         "--rubric",
         dest="rubric_path",
-        default=os.getenv("RUBRIC_PATH"),
-        help="Path to rubric.json",
+        default=None,
+        help="Path to rubric.json (default: $RUBRIC_PATH or rubric/rubric.json)",
     )
     parser.add_argument(
         "--thread-id",
@@ -112,6 +142,16 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+
+    # Load environment variables only once argparse has succeeded, so that
+    # `--help` and argument errors never pay for dotenv or the LLM stack.
+    # Must still run before any src.* import (llm.py reads env at import).
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    args.output_dir = args.output_dir or os.getenv("OUTPUT_DIR", DEFAULT_OUTPUT_DIR)
+    args.rubric_path = args.rubric_path or os.getenv("RUBRIC_PATH")
+
     setup_logging(args.verbose)
 
     logger = logging.getLogger("main")
@@ -127,12 +167,11 @@ def main() -> None:
     logger.info("Output dir:   %s", args.output_dir)
     logger.info("=" * 60)
 
-    # Import here to avoid circular imports and ensure .env is loaded first
-    from src.graph import run_auditor_graph
-    from src.report_generator import render_audit_report
-
     # Run the full auditor graph
     try:
+        # Import here to avoid circular imports and ensure .env is loaded first
+        from src.graph import run_auditor_graph
+
         final_state = run_auditor_graph(
             repo_url=args.repo_url,
             pdf_path=args.pdf_path,
@@ -145,9 +184,22 @@ def main() -> None:
         logger.warning("!" * 60)
         sys.exit(130)  # Standard exit code for SIGINT
 
+    # An interrupted run never yields a trustworthy verdict: the judges
+    # skipped criteria, so do not overwrite a previous report with it
+    if SHUTDOWN_EVENT.is_set():
+        logger.warning("=" * 60)
+        logger.warning(
+            "AUDIT ABORTED: %s",
+            final_state.get("error") or "Audit aborted by user (Ctrl+C).",
+        )
+        logger.warning("=" * 60)
+        sys.exit(130)
+
     # Render the report if we got one
     report = final_state.get("final_report")
     if report:
+        from src.report_generator import render_audit_report
+
         try:
             # Save Markdown Report (the task doc requires Markdown output)
             output_path = os.path.join(args.output_dir, "audit_report.md")
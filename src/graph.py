@@ -33,26 +33,54 @@ merge safely without data loss.
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, START, StateGraph
 
-from src.nodes.detectives import doc_analyst, repo_investigator, vision_inspector_node
-from src.nodes.judges import defense_node, prosecutor_node, tech_lead_node
+from src.json_utils import loads as json_loads
+from src.nodes.detectives import (
+    PDF_CITED_PATHS_GOAL,
+    REPO_MANIFEST_GOAL,
+    doc_analyst,
+    repo_investigator,
+    vision_inspector_node,
+)
+from src.nodes.judges import (
+    defense_node,
+    format_evidence_for_prompt,
+    prosecutor_node,
+    tech_lead_node,
+)
 from src.nodes.justice import chief_justice_node
 from src.report_generator import render_audit_report
+from src.shutdown import shutdown_requested
 from src.state import AgentState, Evidence
+from src.tools.doc_tools import build_path_suffix_index, normalize_path
+
+__all__ = [
+    "DEFAULT_RUBRIC_PATH",
+    "build_auditor_graph",
+    "build_detective_graph",
+    "evidence_aggregator",
+    "judge_dispatch",
+    "judge_sync",
+    "load_rubric",
+    "report_node",
+    "route_after_aggregation",
+    "run_auditor_graph",
+    "run_detective_graph",
+]
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_RUBRIC_PATH = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), "rubric", "rubric.json"
-)
+# Resolved once at import; kept as str so it is a stable cache key
+DEFAULT_RUBRIC_PATH = str(Path(__file__).resolve().parents[1] / "rubric" / "rubric.json")
 
 
 # ---------------------------------------------------------------------------
@@ -67,6 +95,10 @@ def evidence_aggregator(state: AgentState) -> dict:
     operator.ior reducer), performs cross-reference checks between
     DocAnalyst and RepoInvestigator evidence, and logs a summary.
     """
+    if shutdown_requested():
+        # Sole writer of `error` in this superstep; routes straight to END
+        return {"error": "Audit aborted by user (Ctrl+C)."}
+
     evidences = state.get("evidences", {})
     total = sum(len(v) for v in evidences.values())
     logger.info(
@@ -80,77 +112,93 @@ def evidence_aggregator(state: AgentState) -> dict:
     # --- Cross-reference: DocAnalyst paths vs RepoInvestigator file manifest ---
     # GAP 3 FIX: The doc requires DocAnalyst to cross-reference file paths
     # against repo evidence to detect "hallucinations" in the PDF report.
-    doc_evidence = evidences.get("doc", [])
+    # Fast path: the PDF cited no paths (or no PDF was supplied), so skip
+    # building the repo file manifest altogether
+    cited_evidence = [
+        ev
+        for ev in evidences.get("doc", [])
+        if ev.goal == PDF_CITED_PATHS_GOAL and ev.found and ev.content
+    ]
+    if not cited_evidence:
+        return {"evidence_count": total}
     repo_evidence = evidences.get("repo", [])
 
     # Build a set of known files from repo evidence
     repo_files: set = set()
     for ev in repo_evidence:
-        if ev.goal and "file" in ev.goal.lower() and ev.found:
+        if ev.goal == REPO_MANIFEST_GOAL and ev.content:
+            # The full file listing of the clone, one path per line
+            repo_files.update(ev.content.splitlines())
+        elif "file" in ev.goal_tag and ev.found:
             # Extract file paths from location or content
             if ev.location:
                 repo_files.add(ev.location)
             if ev.content:
-                # Content may list file paths
-                for line in ev.content.split("\n"):
-                    stripped = line.strip()
-                    if stripped and ("/" in stripped or "\\" in stripped):
-                        repo_files.add(stripped)
+                # Content may list file paths — one pass, no intermediate list
+                repo_files.update(
+                    line.strip()
+                    for line in ev.content.splitlines()
+                    if "/" in line or "\\" in line
+                )
+
+    # Index every path suffix once so each cited path is an O(1) lookup
+    repo_suffixes = build_path_suffix_index(repo_files)
 
     # Check doc-cited paths against repo evidence
     cross_ref_evidence = []
-    for ev in doc_evidence:
-        if ev.goal and "cross_reference" in ev.goal.lower():
-            # This evidence item contains file paths from the PDF
-            if ev.content:
-                cited_paths = [p.strip() for p in ev.content.split(",") if p.strip()]
-                verified = [p for p in cited_paths if any(p in rf for rf in repo_files)]
-                hallucinated = [
-                    p for p in cited_paths if not any(p in rf for rf in repo_files)
-                ]
-
-                if hallucinated:
-                    cross_ref_evidence.append(
-                        Evidence(
-                            goal="Cross-reference: Hallucinated file paths in PDF",
-                            found=True,
-                            content=f"Hallucinated paths: {hallucinated}. Verified: {verified}",
-                            location="evidence_aggregator/cross_reference",
-                            rationale=(
-                                f"PDF report cited {len(cited_paths)} paths. "
-                                f"{len(verified)} verified, {len(hallucinated)} not found in repo."
-                            ),
-                            confidence=0.9,
-                        )
-                    )
-                    logger.warning(
-                        "Cross-reference found %d hallucinated paths: %s",
-                        len(hallucinated),
-                        hallucinated,
-                    )
-
+    for ev in cited_evidence:
+        # DocAnalyst lists the paths cited in the PDF one per line
+        cited_paths = [p.strip() for p in ev.content.splitlines() if p.strip()]
+        verified, hallucinated = [], []
+        for p in cited_paths:
+            if normalize_path(p) in repo_suffixes:
+                verified.append(p)
+            else:
+                hallucinated.append(p)
+
+        if hallucinated:
+            cross_ref_evidence.append(
+                Evidence(
+                    goal="Cross-reference: Hallucinated file paths in PDF",
+                    found=True,
+                    content=f"Hallucinated paths: {hallucinated}. Verified: {verified}",
+                    location="evidence_aggregator/cross_reference",
+                    rationale=(
+                        f"PDF report cited {len(cited_paths)} paths. "
+                        f"{len(verified)} verified, {len(hallucinated)} not found in repo."
+                    ),
+                    confidence=0.9,
+                )
+            )
+            logger.warning(
+                "Cross-reference found %d hallucinated paths: %s",
+                len(hallucinated),
+                hallucinated,
+            )
+
+    evidence_count = total + len(cross_ref_evidence)
     if cross_ref_evidence:
-        return {"evidences": {"cross_ref": cross_ref_evidence}}
+        return {
+            "evidences": {"cross_ref": cross_ref_evidence},
+            "evidence_count": evidence_count,
+        }
 
-    return {}
+    return {"evidence_count": evidence_count}
 
 
 def judge_dispatch(state: AgentState) -> dict:
     """Fan-out synchronisation point before the judicial layer.
 
     This node is the single source from which the three judge edges
-    fan out.  It performs no state mutation — it exists purely so that
-    LangGraph can dispatch to the three judges in parallel from a
-    common predecessor node.
+    fan out, so LangGraph can dispatch to the three judges in parallel
+    from a common predecessor node.  It also renders the evidence into
+    prompt text once, instead of once per judge.
     """
-    evidence_count = sum(
-        len(ev_list) for ev_list in state.get("evidences", {}).values()
-    )
     logger.info(
         "Judge dispatch: forwarding %d evidence items to the judicial bench.",
-        evidence_count,
+        state.get("evidence_count", 0),
     )
-    return {}
+    return {"evidence_text": format_evidence_for_prompt(state.get("evidences", {}))}
 
 
 def judge_sync(state: AgentState) -> dict:
@@ -160,6 +208,10 @@ def judge_sync(state: AgentState) -> dict:
     via the operator.add reducer) and logs a summary before handing
     off to the Chief Justice.
     """
+    if shutdown_requested():
+        # Judges stop mid-rubric on Ctrl+C; flag the opinion set as partial
+        return {"error": "Audit aborted by user (Ctrl+C)."}
+
     opinions = state.get("opinions", [])
     logger.info(
         "Judge sync: %d judicial opinions collected, forwarding to Chief Justice.",
@@ -176,7 +228,10 @@ def report_node(state: AgentState) -> dict:
     """
     report = state.get("final_report")
     if report is None:
-        logger.error("report_node received no final_report in state.")
+        if state.get("error"):
+            logger.warning("No report produced: %s", state["error"])
+        else:
+            logger.error("report_node received no final_report in state.")
         return {}
 
     logger.info(
@@ -213,22 +268,13 @@ def route_after_aggregation(
 # ---------------------------------------------------------------------------
 
 
-def build_auditor_graph(checkpointer: Optional[MemorySaver] = None) -> StateGraph:
-    """Build and compile the complete Automaton Auditor StateGraph.
-
-    Architecture:
-        Detective Fan-Out:  START → [repo_investigator, doc_analyst, vision_inspector]
-        Detective Fan-In:   → evidence_aggregator
-        Routing:            evidence_aggregator →[conditional]→ judge_dispatch | END
-        Judge Fan-Out:      judge_dispatch → [prosecutor, defense, tech_lead]
-        Judge Fan-In:       → judge_sync
-        Synthesis:          judge_sync → chief_justice → report_node → END
-
-    Args:
-        checkpointer: Optional MemorySaver for crash recovery.
+@functools.lru_cache(maxsize=1)
+def _compile_auditor_graph() -> StateGraph:
+    """Build and compile the courtroom topology once per process.
 
-    Returns:
-        Compiled LangGraph application.
+    Node registration, edge wiring and Pregel compilation are fully
+    deterministic, so the compiled graph is memoised.  It is compiled
+    without a checkpointer; ``build_auditor_graph`` attaches one per call.
     """
     builder = StateGraph(AgentState)
 
@@ -251,6 +297,9 @@ def build_auditor_graph(checkpointer: Optional[MemorySaver] = None) -> StateGrap
     builder.add_node("report_node", report_node)
 
     # --- Detective Fan-Out: START → all detectives in parallel ---------------
+    # Nodes in the same superstep are executed concurrently by LangGraph
+    # (sync nodes on its thread-pool executor), so the blocking clone / PDF
+    # parse / vision calls overlap: the phase costs max(), not sum().
     builder.add_edge(START, "repo_investigator")
     builder.add_edge(START, "doc_analyst")
     builder.add_edge(START, "vision_inspector")
@@ -271,6 +320,9 @@ def build_auditor_graph(checkpointer: Optional[MemorySaver] = None) -> StateGrap
     )
 
     # --- Judge Fan-Out: dispatch → all judges in parallel --------------------
+    # Same superstep, so the three benches run concurrently; each judge caps
+    # its own criterion pool at JUDGE_MAX_CONCURRENCY workers, so in-flight
+    # LLM calls are bounded at 3 × that (6 by default).
     builder.add_edge("judge_dispatch", "prosecutor")
     builder.add_edge("judge_dispatch", "defense")
     builder.add_edge("judge_dispatch", "tech_lead")
@@ -286,14 +338,37 @@ def build_auditor_graph(checkpointer: Optional[MemorySaver] = None) -> StateGrap
     builder.add_edge("report_node", END)
 
     # --- Compile -------------------------------------------------------------
-    if checkpointer is None:
-        checkpointer = MemorySaver()
-
-    graph = builder.compile(checkpointer=checkpointer)
+    graph = builder.compile()
     logger.info("Auditor graph compiled successfully (full courtroom).")
     return graph
 
 
+def build_auditor_graph(checkpointer: Optional[MemorySaver] = None) -> StateGraph:
+    """Build and compile the complete Automaton Auditor StateGraph.
+
+    Architecture:
+        Detective Fan-Out:  START → [repo_investigator, doc_analyst, vision_inspector]
+        Detective Fan-In:   → evidence_aggregator
+        Routing:            evidence_aggregator →[conditional]→ judge_dispatch | END
+        Judge Fan-Out:      judge_dispatch → [prosecutor, defense, tech_lead]
+        Judge Fan-In:       → judge_sync
+        Synthesis:          judge_sync → chief_justice → report_node → END
+
+    The compiled topology is cached (see ``_compile_auditor_graph``); each
+    call returns a cheap copy bound to its own checkpointer so separate
+    audits never share checkpointed state.
+
+    Args:
+        checkpointer: Optional MemorySaver for crash recovery.
+
+    Returns:
+        Compiled LangGraph application.
+    """
+    if checkpointer is None:
+        checkpointer = MemorySaver()
+    return _compile_auditor_graph().copy(update={"checkpointer": checkpointer})
+
+
 # Backward-compatible alias
 build_detective_graph = build_auditor_graph
 
@@ -303,17 +378,28 @@ build_detective_graph = build_auditor_graph
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8)
+def _load_rubric_dimensions(path: str, mtime_ns: int) -> tuple:
+    """Parse rubric.json once per (path, mtime); edits to the file bust the cache."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    rubric = json_loads(raw)
+    return tuple(rubric.get("dimensions", []))
+
+
 def load_rubric(rubric_path: Optional[str] = None) -> list:
     """Load rubric dimensions from rubric.json.
 
+    Parsed dimensions are memoised by file mtime, so repeated audits
+    against an unchanged rubric skip the read and parse entirely.  The
+    dimension dicts are shared between calls — treat them as read-only.
+
     Returns:
         List of dimension dicts from the rubric JSON.
     """
     path = rubric_path or DEFAULT_RUBRIC_PATH
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            rubric = json.load(f)
-        dimensions = rubric.get("dimensions", [])
+        dimensions = list(_load_rubric_dimensions(path, os.stat(path).st_mtime_ns))
         logger.info("Loaded %d rubric dimensions from %s", len(dimensions), path)
         return dimensions
     except Exception as exc:
@@ -321,6 +407,24 @@ def load_rubric(rubric_path: Optional[str] = None) -> list:
         return []
 
 
+# Upper bound on how long run_auditor_graph waits for the diagram on return
+DIAGRAM_JOIN_TIMEOUT = 30.0
+
+
+def _render_graph_diagram(graph, output_dir: str) -> None:
+    """Render the compiled graph as a Mermaid PNG into *output_dir*."""
+    try:
+        mermaid_png = graph.get_graph().draw_mermaid_png()
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / "auditor_graph.png"
+        with open(out_path, "wb") as f:
+            f.write(mermaid_png)
+        logger.info("Saved graph diagram to %s", out_path)
+    except Exception as exc:
+        logger.warning("Failed to render graph diagram: %s", exc)
+
+
 def run_auditor_graph(
     repo_url: str,
     pdf_path: Optional[str] = None,
@@ -335,22 +439,24 @@ def run_auditor_graph(
         pdf_path: Local path to the PDF report (optional).
         rubric_path: Path to rubric.json (defaults to rubric/rubric.json).
         thread_id: Unique thread ID for checkpointing.
+        output_dir: If set, auditor_graph.png is rendered there on a
+            background thread while the audit runs.
 
     Returns:
         The final AgentState dict after execution.
     """
     graph = build_auditor_graph()
-    # if caller requested a diagram, render and save
+    # if caller requested a diagram, render and save it in the background —
+    # draw_mermaid_png() is a network round-trip and must not delay the audit
+    diagram_thread = None
     if output_dir:
-        try:
-            mermaid_png = graph.get_graph().draw_mermaid_png()
-            out_path = Path(output_dir) / "auditor_graph.png"
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(out_path, "wb") as f:
-                f.write(mermaid_png)
-            logger.info("Saved graph diagram to %s", out_path)
-        except Exception as exc:
-            logger.warning("Failed to render graph diagram: %s", exc)
+        diagram_thread = threading.Thread(
+            target=_render_graph_diagram,
+            args=(graph, output_dir),
+            name="graph-diagram",
+            daemon=True,
+        )
+        diagram_thread.start()
     dimensions = load_rubric(rubric_path)
 
     initial_state = {
@@ -358,6 +464,8 @@ def run_auditor_graph(
         "pdf_path": pdf_path or "",
         "rubric_dimensions": dimensions,
         "evidences": {},
+        "evidence_count": 0,
+        "evidence_text": "",
         "opinions": [],
         "final_report": None,
         "error": None,
@@ -366,7 +474,9 @@ def run_auditor_graph(
     config = {"configurable": {"thread_id": thread_id}}
 
     logger.info("Starting full auditor graph for %s", repo_url)
-    final_state = graph.invoke(initial_state, config)
+    # Checkpoint once when the graph exits (success or error) instead of
+    # after every superstep: intermediate checkpoints are never read back.
+    final_state = graph.invoke(initial_state, config, durability="exit")
     logger.info(
         "Auditor graph complete — overall score: %s",
         (
@@ -375,4 +485,12 @@ def run_auditor_graph(
             else "N/A"
         ),
     )
+    if diagram_thread is not None:
+        diagram_thread.join(timeout=DIAGRAM_JOIN_TIMEOUT)
+        if diagram_thread.is_alive():
+            logger.warning("Graph diagram still rendering; not waiting for it.")
     return final_state
+
+
+# Backward-compatible alias for the interim detective-only runner
+run_detective_graph = run_auditor_graph
@@ -0,0 +1,23 @@
+"""
+json_utils.py — Shared JSON parsing for the Automaton Auditor swarm.
+
+orjson is an optional C parser; when it is not installed the stdlib
+``json`` module is used instead.  Both accept ``str`` or ``bytes`` and
+raise a ``ValueError`` subclass on malformed input, so callers need not
+care which one is active.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -31,11 +31,19 @@ Configuration via .env:
   ANTHROPIC_API_KEY=sk-ant-...
   GOOGLE_API_KEY=AIza...
     GROQ_API_KEY=grq-...  # Groq Cloud API key (optional)
+
+  # Persistent response cache (optional, needs langchain-community)
+  LLM_CACHE_PATH=.langchain_cache.db
+
+  # Shared request-rate cap per provider/model (optional)
+  LLM_REQUESTS_PER_SECOND=0.5
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
 import os
 from typing import Optional, Type, TypeVar
 
@@ -95,6 +103,19 @@ def _resolve_config(role: Optional[str] = None) -> dict:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_http_client():
+    """Process-wide httpx client for SDKs that accept one (OpenAI, Groq).
+
+    Lets every ChatModel reuse the same keep-alive pool, so judges and the
+    Chief Justice hitting the same endpoint skip repeated TLS handshakes.
+    Per-request timeouts are still set by each model's ``timeout``.
+    """
+    import httpx
+
+    return httpx.Client(limits=httpx.Limits(max_keepalive_connections=16))
+
+
 def _create_ollama(model: str, temperature: float):
     """Create a ChatOllama instance."""
     from langchain_ollama import ChatOllama
@@ -125,6 +146,7 @@ def _create_openai(model: str, temperature: float):
         api_key=api_key,
         temperature=temperature,
         timeout=30,
+        http_client=_shared_http_client(),
     )
     if tracer is not None:
         kwargs["callbacks"] = [tracer]
@@ -196,6 +218,7 @@ def _create_groq(model: str, temperature: float):
         api_key=api_key,
         temperature=temperature,
         timeout=30,
+        http_client=_shared_http_client(),
     )
     if tracer is not None:
         kwargs["callbacks"] = [tracer]
@@ -245,6 +268,86 @@ def _maybe_get_tracer():
         return None
 
 
+# ---------------------------------------------------------------------------
+# Response cache helper
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def _maybe_enable_llm_cache() -> bool:
+    """Install a persistent SQLite LLM response cache when `LLM_CACHE_PATH` is set.
+
+    Opt-in: re-auditing the same repo + PDF + rubric then replays identical
+    judge / DocAnalyst / vision prompts from disk instead of the API, which
+    also makes the verdicts repeat exactly.  Delete the file (or edit a
+    prompt — the cache key is the full prompt plus model params) to force
+    fresh calls.  Requires the optional `langchain-community` package.
+    """
+    path = os.getenv("LLM_CACHE_PATH")
+    if not path:
+        return False
+    try:
+        from langchain_community.cache import SQLiteCache
+        from langchain_core.globals import set_llm_cache
+    except ImportError:
+        logger.warning(
+            "LLM_CACHE_PATH is set but langchain-community is not installed; "
+            "LLM responses will not be cached."
+        )
+        return False
+    set_llm_cache(SQLiteCache(database_path=path))
+    logger.info("LLM response cache enabled at %s", path)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting helper
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def _requests_per_second() -> Optional[float]:
+    """Parse `LLM_REQUESTS_PER_SECOND` once; None disables rate limiting.
+
+    Zero, negative, non-finite or unparsable values are rejected with a warning — a
+    zero-rate limiter would block every LLM call forever.
+    """
+    raw = os.getenv("LLM_REQUESTS_PER_SECOND")
+    if not raw:
+        return None
+    try:
+        rps = float(raw)
+    except ValueError:
+        rps = 0.0
+    if not (rps > 0 and math.isfinite(rps)):
+        logger.warning(
+            "Ignoring LLM_REQUESTS_PER_SECOND=%r: expected a positive number; "
+            "rate limiting is disabled.",
+            raw,
+        )
+        return None
+    return rps
+
+
+@functools.lru_cache(maxsize=None)
+def _rate_limiter(provider: str, model: str):
+    """Return the process-wide request limiter for a provider/model, if configured.
+
+    `LLM_REQUESTS_PER_SECOND` caps the combined request rate of every node
+    that resolves to the same provider and model — DocAnalyst, the vision
+    batch and all three judges draw from one token bucket, so their
+    concurrent calls queue locally instead of tripping the provider's 429s.
+    Unset (the default) means no limiter; the per-node 429 backoff remains
+    either way as the last line of defence.
+    """
+    rps = _requests_per_second()
+    if rps is None:
+        return None
+    from langchain_core.rate_limiters import InMemoryRateLimiter
+
+    return InMemoryRateLimiter(requests_per_second=rps)
+
+
 # Registry mapping provider names to constructors
 _PROVIDERS = {
     "ollama": _create_ollama,
@@ -256,6 +359,23 @@ _PROVIDERS = {
 }
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_llm(provider: str, model: str, temperature: float):
+    """Construct the ChatModel for a resolved config once and reuse it.
+
+    Chat models are stateless between calls, so every judge criterion and
+    narrative call can share one instance (and its HTTP client) instead of
+    re-running SDK setup per invocation.  Factory errors (e.g. a missing
+    API key) are not cached.
+    """
+    _maybe_enable_llm_cache()
+    llm = _PROVIDERS[provider](model, temperature)
+    limiter = _rate_limiter(provider, model)
+    if limiter is not None:
+        llm.rate_limiter = limiter
+    return llm
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -281,27 +401,30 @@ def get_llm(
         model: Override the model name.
 
     Returns:
-        A LangChain ChatModel instance.
+        A LangChain ChatModel instance, shared by all callers that resolve
+        to the same provider, model and temperature.
     """
     cfg = _resolve_config(role)
     prov = provider or cfg["provider"]
     mdl = model or cfg["model"]
 
-    factory = _PROVIDERS.get(prov.lower())
-    if factory is None:
+    key = prov.lower()
+    if key not in _PROVIDERS:
         supported = ", ".join(_PROVIDERS.keys())
         raise ValueError(f"Unknown LLM provider '{prov}'. Supported: {supported}")
 
-    logger.debug(
-        "Creating LLM: provider=%s, model=%s, role=%s, temperature=%.2f",
-        prov,
-        mdl,
-        role or "default",
-        temperature,
-    )
-    return factory(mdl, temperature)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Creating LLM: provider=%s, model=%s, role=%s, temperature=%.2f",
+            prov,
+            mdl,
+            role or "default",
+            temperature,
+        )
+    return _cached_llm(key, mdl, temperature)
 
 
+@functools.lru_cache(maxsize=32)
 def get_structured_llm(
     schema: Type[T],
     role: Optional[str] = None,
@@ -312,6 +435,8 @@ def get_structured_llm(
     """Return a ChatModel bound to a Pydantic schema via `.with_structured_output()`.
 
     The returned object always returns instances of *schema* on `.invoke()`.
+    Results are memoised per argument set, so the schema wrapping runs once
+    per (schema, role, temperature, provider, model) rather than per call.
 
     Args:
         schema: A Pydantic BaseModel subclass.
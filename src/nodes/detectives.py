@@ -1,7 +1,18 @@
+import ast
+import base64
+import functools
+import hashlib
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
+from langchain_core.messages import HumanMessage
+
+from src.llm import get_llm
+from src.shutdown import SHUTDOWN_EVENT, shutdown_requested
 from src.state import AgentState, Evidence
 from src.tools.doc_tools import (
     extract_file_paths_from_text,
@@ -17,13 +28,15 @@ from src.tools.repo_tools import (
     extract_git_history,
     file_exists,
     list_repo_files,
+    parse_python_file,
     read_file,
+    resolve_head_commit,
     scan_for_security_violations,
 )
 
 logger = logging.getLogger(__name__)
 
-REQUIRED_INTERIM_FILES = [
+REQUIRED_INTERIM_FILES = (
     "src/state.py",
     "src/tools/repo_tools.py",
     "src/tools/doc_tools.py",
@@ -32,13 +45,42 @@ REQUIRED_INTERIM_FILES = [
     "pyproject.toml",
     ".env.example",
     "README.md",
-]
+)
 
-REQUIRED_FINAL_FILES = REQUIRED_INTERIM_FILES + [
+REQUIRED_FINAL_FILES = REQUIRED_INTERIM_FILES + (
     "src/nodes/judges.py",
     "src/nodes/justice.py",
     "rubric/rubric.json",
-]
+)
+
+# Goal of the DocAnalyst evidence that lists the file paths cited in the PDF;
+# the evidence aggregator selects it by this exact value for cross-referencing
+PDF_CITED_PATHS_GOAL = "Extract file paths claimed in PDF for hallucination cross-reference"
+
+# Goal of the RepoInvestigator evidence listing every file in the clone —
+# the manifest those cited paths are checked against
+REPO_MANIFEST_GOAL = "Build repository file manifest"
+
+# Diagrams sent to the vision model at once (kept low for free-tier rate limits)
+VISION_MAX_CONCURRENCY = 3
+
+# DocAnalyst concept verifications sent to the LLM at once (same reasoning)
+DOC_LLM_MAX_CONCURRENCY = 4
+
+# RepoInvestigator output is a pure function of the commit it analysed, so
+# repeat audits of an unchanged repo in one process skip clone + analysis.
+# Keyed by (repo_url, HEAD sha); oldest entry evicted past the cap.
+REPO_EVIDENCE_CACHE_SIZE = 8
+_repo_evidence_cache: Dict[Tuple[str, str], Tuple[Evidence, ...]] = {}
+
+# Step-function tables for the confidence scorers: a count at or above
+# THRESHOLDS[i] earns BONUS[i + 1] (bisect picks the bracket in one lookup)
+COMMIT_COUNT_THRESHOLDS = (2, 5, 10)
+COMMIT_COUNT_BONUS = (0.0, 0.1, 0.2, 0.3)
+EDGE_COUNT_THRESHOLDS = (1, 3, 6)
+EDGE_COUNT_BONUS = (0.0, 0.1, 0.2, 0.3)
+CHUNK_HIT_THRESHOLDS = (2, 5)
+CHUNK_HIT_BONUS = (0.0, 0.07, 0.15)
 
 
 def confidence_git_history(git_data: Dict) -> float:
@@ -52,14 +94,9 @@ def confidence_git_history(git_data: Dict) -> float:
     score += 0.4
 
     # Number of commits adds credibility — more history = richer evidence
+    # (1 commit = no addition)
     commit_count = git_data["total_commits"]
-    if commit_count >= 10:
-        score += 0.3
-    elif commit_count >= 5:
-        score += 0.2
-    elif commit_count >= 2:
-        score += 0.1
-    # 1 commit = no addition
+    score += COMMIT_COUNT_BONUS[bisect_right(COMMIT_COUNT_THRESHOLDS, commit_count)]
 
     # Clear progression across phases = strong structural signal
     if git_data.get("progression_detected"):
@@ -111,12 +148,7 @@ def confidence_graph_structure(graph_analysis: Dict) -> float:
 
     # Edge count: more wiring = stronger evidence of real orchestration
     edge_count = len(graph_analysis.get("add_edge_calls", []))
-    if edge_count >= 6:
-        score += 0.3
-    elif edge_count >= 3:
-        score += 0.2
-    elif edge_count >= 1:
-        score += 0.1
+    score += EDGE_COUNT_BONUS[bisect_right(EDGE_COUNT_THRESHOLDS, edge_count)]
 
     # Fan-out is the key structural requirement — parallel branches confirmed
     if graph_analysis.get("fan_out_detected"):
@@ -181,10 +213,7 @@ def confidence_pdf_concept(concept_data: Dict) -> float:
 
     # Breadth: concept discussed across multiple chunks = richer coverage
     chunks_with_hits = concept_data.get("chunks_with_hits", 0)
-    if chunks_with_hits >= 5:
-        score += 0.15
-    elif chunks_with_hits >= 2:
-        score += 0.07
+    score += CHUNK_HIT_BONUS[bisect_right(CHUNK_HIT_THRESHOLDS, chunks_with_hits)]
 
     return round(min(score, 1.0), 2)
 
@@ -200,6 +229,24 @@ def confidence_path_crossref(crossref_result: Dict) -> float:
     return round(crossref_result.get("accuracy_score", 0.0), 2)
 
 
+def _file_digest(path: str) -> Optional[str]:
+    """Content hash of *path* (blake2b-128), or None if it cannot be read."""
+    try:
+        return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _ingest_and_scan_pdf(pdf_path: str, digest: str) -> Tuple[Dict, Dict]:
+    """Ingest a PDF and run the concept scans, once per content digest.
+
+    Results are shared between calls — treat them as read-only.
+    """
+    ingested = ingest_pdf(pdf_path)
+    return ingested, verify_all_forensic_concepts(ingested)
+
+
 def repo_investigator(state: AgentState) -> List[Evidence]:
     repo_url = state["repo_url"]
     rubric_dimensions = state.get("rubric_dimensions", [])
@@ -209,6 +256,27 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
 
     evidences: List[Evidence] = []
 
+    if shutdown_requested():
+        logger.warning("RepoInvestigator: shutdown requested, skipping clone.")
+        return {"evidences": {"repo": evidences}}
+
+    # A rubric with no repo dimensions needs no clone — unless it grades the
+    # PDF, whose cited paths are cross-referenced against the repo evidence.
+    if (
+        rubric_dimensions
+        and not repo_dims
+        and not any(d.get("target_artifact") == "pdf_report" for d in rubric_dimensions)
+    ):
+        logger.info("RepoInvestigator: rubric has no github_repo dimensions, skipping clone.")
+        return {"evidences": {"repo": evidences}}
+
+    # Only pay for `git ls-remote` once this URL has been audited before
+    if any(url == repo_url for url, _ in _repo_evidence_cache):
+        cached = _repo_evidence_cache.get((repo_url, resolve_head_commit(repo_url)))
+        if cached is not None:
+            logger.info("RepoInvestigator: HEAD unchanged, reusing %d evidence items", len(cached))
+            return {"evidences": {"repo": list(cached)}}
+
     tmp_dir, clone_error = clone_repo_sandboxed(repo_url)
 
     if clone_error:
@@ -224,8 +292,29 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
         )
         return {"evidences": {"repo": evidences}}
 
+    # Independent probes run on a small pool and each result is collected
+    # where its evidence is built, so they overlap with each other and with
+    # the file / schema checks below: the `git log` subprocess, the full-tree
+    # AST security scan, HEAD resolution (the evidence-cache key), reads of
+    # repo_tools.py and judges.py, and the parse of justice.py through the
+    # shared AST cache.
+    probes = ThreadPoolExecutor(max_workers=4, thread_name_prefix="repo-probe")
     try:
-        git_data = extract_git_history(tmp_dir)
+        git_future = probes.submit(extract_git_history, tmp_dir)
+        violations_future = probes.submit(scan_for_security_violations, tmp_dir)
+        head_future = probes.submit(resolve_head_commit, tmp_dir)
+        source_futures = {
+            rel_path: probes.submit(read_file, tmp_dir, rel_path)
+            for rel_path in (
+                "src/tools/repo_tools.py",
+                "src/nodes/judges.py",
+            )
+        }
+        justice_future = probes.submit(
+            parse_python_file, os.path.join(tmp_dir, "src/nodes/justice.py")
+        )
+
+        git_data = git_future.result()
         conf = confidence_git_history(git_data)
 
         evidences.append(
@@ -248,8 +337,13 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
             )
         )
 
+        # Every later existence check targets one of these files — stat each
+        # once and answer the rest from this set
+        existing = set()
         for required_file in REQUIRED_INTERIM_FILES:
             present = file_exists(tmp_dir, required_file)
+            if present:
+                existing.add(required_file)
             evidences.append(
                 Evidence(
                     goal=f"Verify required file exists: {required_file}",
@@ -264,9 +358,24 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
                 )
             )
 
+        manifest = list_repo_files(tmp_dir)
+        evidences.append(
+            Evidence(
+                goal=REPO_MANIFEST_GOAL,
+                found=bool(manifest),
+                content="\n".join(manifest) if manifest else None,
+                location=repo_url,
+                rationale=(
+                    f"{len(manifest)} file(s) listed by walking the clone. "
+                    "[signal: deterministic — directory walk]"
+                ),
+                confidence=1.0,
+            )
+        )
+
         state_file: Optional[str] = None
         for candidate in ["src/state.py", "src/graph.py"]:
-            if file_exists(tmp_dir, candidate):
+            if candidate in existing:
                 state_file = candidate
                 break
 
@@ -322,7 +431,7 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
                 )
             )
 
-        if file_exists(tmp_dir, "src/graph.py"):
+        if "src/graph.py" in existing:
             graph_analysis = analyze_graph_structure(
                 os.path.join(tmp_dir, "src/graph.py")
             )
@@ -361,9 +470,9 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
                     )
                 )
 
-        violations = scan_for_security_violations(tmp_dir)
+        violations = violations_future.result()
 
-        repo_tools_source = read_file(tmp_dir, "src/tools/repo_tools.py")
+        repo_tools_source = source_futures["src/tools/repo_tools.py"].result()
         file_was_readable = repo_tools_source is not None
         tempfile_used = "tempfile" in (repo_tools_source or "")
         subprocess_used = "subprocess.run" in (repo_tools_source or "")
@@ -419,11 +528,13 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
         # Dimension 5: structured_output_enforcement
         # Scan judges.py for .with_structured_output() / .bind_tools()
         # ---------------------------------------------------------------
-        judges_source = read_file(tmp_dir, "src/nodes/judges.py")
+        judges_source = source_futures["src/nodes/judges.py"].result()
+        # Case-fold once — both judges.py dimensions scan the lowered text
+        judges_lower = judges_source.lower() if judges_source else ""
         if judges_source:
             has_structured_output = ".with_structured_output" in judges_source
             has_bind_tools = ".bind_tools" in judges_source
-            has_retry = "retry" in judges_source.lower() or "MAX_RETRIES" in judges_source
+            has_retry = "retry" in judges_lower or "MAX_RETRIES" in judges_source
             has_judicial_opinion_schema = "JudicialOpinion" in judges_source
 
             evidences.append(
@@ -463,18 +574,21 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
         # Verify distinct personas for Prosecutor, Defense, TechLead
         # ---------------------------------------------------------------
         if judges_source:
-            has_prosecutor_prompt = "PROSECUTOR" in judges_source.upper()
-            has_defense_prompt = "DEFENSE" in judges_source.upper()
-            has_tech_lead_prompt = "TECH_LEAD" in judges_source.upper() or "TECHLEAD" in judges_source.upper()
+            # Plain `in` on the lowered source beats a keyword alternation
+            # regex here: each test is a C-level substring search, the regex
+            # walks the text in Python's backtracking engine.
+            has_prosecutor_prompt = "prosecutor" in judges_lower
+            has_defense_prompt = "defense" in judges_lower
+            has_tech_lead_prompt = "tech_lead" in judges_lower or "techlead" in judges_lower
 
             # Check for adversarial / forgiving / pragmatic keywords
             adversarial_keywords = ["trust no one", "vibe coding", "scrutinize", "gaps", "security flaws", "laziness"]
             forgiving_keywords = ["reward effort", "spirit of the law", "creative workarounds", "intent"]
             pragmatic_keywords = ["does it actually work", "maintainable", "architectural soundness", "technical debt"]
 
-            adversarial_count = sum(1 for kw in adversarial_keywords if kw.lower() in judges_source.lower())
-            forgiving_count = sum(1 for kw in forgiving_keywords if kw.lower() in judges_source.lower())
-            pragmatic_count = sum(1 for kw in pragmatic_keywords if kw.lower() in judges_source.lower())
+            adversarial_count = sum(kw in judges_lower for kw in adversarial_keywords)
+            forgiving_count = sum(kw in judges_lower for kw in forgiving_keywords)
+            pragmatic_count = sum(kw in judges_lower for kw in pragmatic_keywords)
 
             all_three_distinct = has_prosecutor_prompt and has_defense_prompt and has_tech_lead_prompt
             personas_rich = adversarial_count >= 2 and forgiving_count >= 2 and pragmatic_count >= 2
@@ -505,9 +619,11 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
         # Dimension 7: chief_justice_synthesis
         # Verify deterministic Python rules in justice.py
         # ---------------------------------------------------------------
-        justice_source = read_file(tmp_dir, "src/nodes/justice.py")
+        try:
+            justice_source, justice_tree, _ = justice_future.result()
+        except OSError:
+            justice_source, justice_tree = None, None
         if justice_source:
-            import ast as _ast
             has_deterministic_logic = False
             has_security_override = False
             has_fact_supremacy = False
@@ -515,18 +631,18 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
             has_audit_report = "AuditReport" in justice_source
 
             # Check for deterministic if/else logic via AST
-            try:
-                justice_tree = _ast.parse(justice_source)
+            if justice_tree is not None:
                 # Count if-statements — deterministic logic indicator
-                if_count = sum(1 for node in _ast.walk(justice_tree) if isinstance(node, _ast.If))
+                if_count = sum(1 for node in ast.walk(justice_tree) if isinstance(node, ast.If))
                 has_deterministic_logic = if_count >= 3  # At least 3 if-blocks = real logic
-            except SyntaxError:
-                pass
 
             # Check for specific synthesis rules
-            has_security_override = "security" in justice_source.lower() and "cap" in justice_source.lower()
-            has_fact_supremacy = "evidence" in justice_source.lower() and "overrul" in justice_source.lower()
-            has_variance_rule = "variance" in justice_source.lower() and "re-evaluat" in justice_source.lower() or "re_evaluat" in justice_source.lower()
+            justice_lower = justice_source.lower()
+            has_security_override = "security" in justice_lower and "cap" in justice_lower
+            has_fact_supremacy = "evidence" in justice_lower and "overrul" in justice_lower
+            has_variance_rule = "variance" in justice_lower and (
+                "re-evaluat" in justice_lower or "re_evaluat" in justice_lower
+            )
 
             all_rules = has_security_override and has_fact_supremacy and has_deterministic_logic
 
@@ -565,9 +681,17 @@ def repo_investigator(state: AgentState) -> List[Evidence]:
                 )
             )
 
+        head_sha = head_future.result()
+
     finally:
+        probes.shutdown(wait=True)  # probes must finish before the clone is deleted
         cleanup_repo(tmp_dir)
 
+    if head_sha and not shutdown_requested():
+        if len(_repo_evidence_cache) >= REPO_EVIDENCE_CACHE_SIZE:
+            _repo_evidence_cache.pop(next(iter(_repo_evidence_cache)))
+        _repo_evidence_cache[(repo_url, head_sha)] = tuple(evidences)
+
     logger.info("RepoInvestigator collected %d evidence items", len(evidences))
     return {"evidences": {"repo": evidences}}
 
@@ -599,7 +723,17 @@ def doc_analyst(state: AgentState) -> List[Evidence]:
         )
         return {"evidences": {"doc": evidences}}
 
-    ingested = ingest_pdf(pdf_path)
+    if shutdown_requested():
+        logger.warning("DocAnalyst: shutdown requested, skipping PDF analysis.")
+        return {"evidences": {"doc": evidences}}
+
+    digest = _file_digest(pdf_path)
+    if digest is not None:
+        # Same bytes → same parse: re-audits of an unchanged PDF skip pdfplumber
+        ingested, concept_results = _ingest_and_scan_pdf(pdf_path, digest)
+    else:
+        ingested = ingest_pdf(pdf_path)
+        concept_results = None
 
     if ingested.get("error"):
         evidences.append(
@@ -625,7 +759,8 @@ def doc_analyst(state: AgentState) -> List[Evidence]:
         )
     )
 
-    concept_results = verify_all_forensic_concepts(ingested)
+    if concept_results is None:
+        concept_results = verify_all_forensic_concepts(ingested)
 
     concept_display_names = {
         "dialectical_synthesis": "Dialectical Synthesis",
@@ -701,7 +836,7 @@ def doc_analyst(state: AgentState) -> List[Evidence]:
         conf = 1.0  # extraction is deterministic regex — either found or not
         evidences.append(
             Evidence(
-                goal="Extract file paths claimed in PDF for hallucination cross-reference",
+                goal=PDF_CITED_PATHS_GOAL,
                 found=True,
                 content="\n".join(claimed_paths),
                 location=pdf_path,
@@ -716,7 +851,7 @@ def doc_analyst(state: AgentState) -> List[Evidence]:
     else:
         evidences.append(
             Evidence(
-                goal="Extract file paths claimed in PDF for hallucination cross-reference",
+                goal=PDF_CITED_PATHS_GOAL,
                 found=False,
                 content=None,
                 location=pdf_path,
@@ -729,13 +864,11 @@ def doc_analyst(state: AgentState) -> List[Evidence]:
     # Per the doc: "Scan for deep understanding... Does the text just drop the keyword, or does it explain how the architecture executes it?"
     # If LLM is available, we add a "Deep Verification" layer to the DocAnalyst.
     try:
-        from src.llm import get_llm
-        from langchain_core.messages import HumanMessage
-        
         # Resolve LLM for doc role
         doc_llm = get_llm(role="doc", temperature=0.1)
         logger.info("DocAnalyst: LLM available, performing deep concept verification")
 
+        pending = []
         for concept, qr in concept_results.items():
             if qr["found"] and qr["top_chunks"]:
                 top_text = "\n\n".join([f"Page {c['page']}: {c['text']}" for c in qr["top_chunks"]])
@@ -745,33 +878,53 @@ def doc_analyst(state: AgentState) -> List[Evidence]:
                     f"Does the author provide a SUBSTANTIVE explanation of how they implemented or used '{concept}'? "
                     f"Answer with 'YES' or 'NO' and a 1-sentence explanation."
                 )
-                import time
-                backoff = 1.0
-                for attempt in range(1, 4):
-                    try:
-                        response = doc_llm.invoke([HumanMessage(content=prompt)])
-                        # Update evidence based on LLM "second opinion"
-                        is_substantive = "yes" in response.content.lower()[:5]
-                        evidences.append(Evidence(
-                            goal=f"LLM Deep Verification: {concept}",
-                            found=is_substantive,
-                            content=response.content,
-                            location=pdf_path,
-                            rationale=(
-                                f"LLM analyzed the top chunks for '{concept}'. "
-                                f"Verdict: {'Substantive explanation found' if is_substantive else 'Potential keyword dropping detected'}."
-                            ),
-                            confidence=0.8
-                        ))
-                        break
-                    except Exception as e:
-                        if "429" in str(e) or "too many requests" in str(e).lower():
-                            logger.info("DocAnalyst rate limited for %s. Backing off %.1fs...", concept, backoff)
-                            time.sleep(backoff)
-                            backoff *= 2.0
-                        else:
-                            logger.debug("DocLLM failed for concept %s: %s", concept, e)
-                            break
+                pending.append((concept, [HumanMessage(content=prompt)]))
+
+        # Concepts are verified concurrently in one batch per attempt; only
+        # the rate-limited ones are retried, after a shared backoff
+        verdicts = {}
+        backoff = 1.0
+        for attempt in range(1, 4):
+            if not pending or shutdown_requested():
+                break
+            responses = doc_llm.batch(
+                [messages for _, messages in pending],
+                config={"max_concurrency": DOC_LLM_MAX_CONCURRENCY},
+                return_exceptions=True,
+            )
+            rate_limited = []
+            for (concept, messages), response in zip(pending, responses):
+                if not isinstance(response, Exception):
+                    verdicts[concept] = response
+                elif "429" in str(response) or "too many requests" in str(response).lower():
+                    rate_limited.append((concept, messages))
+                else:
+                    logger.debug("DocLLM failed for concept %s: %s", concept, response)
+            pending = rate_limited
+            if pending:
+                logger.info("DocAnalyst rate limited for %d concept(s). Backing off %.1fs...",
+                            len(pending), backoff)
+                if SHUTDOWN_EVENT.wait(backoff):
+                    break
+                backoff *= 2.0
+
+        for concept in concept_results:
+            if concept not in verdicts:
+                continue
+            response = verdicts[concept]
+            # Update evidence based on LLM "second opinion"
+            is_substantive = "yes" in response.content.lower()[:5]
+            evidences.append(Evidence(
+                goal=f"LLM Deep Verification: {concept}",
+                found=is_substantive,
+                content=response.content,
+                location=pdf_path,
+                rationale=(
+                    f"LLM analyzed the top chunks for '{concept}'. "
+                    f"Verdict: {'Substantive explanation found' if is_substantive else 'Potential keyword dropping detected'}."
+                ),
+                confidence=0.8
+            ))
 
     except Exception as exc:
         logger.debug("DocAnalyst: LLM deep verification skipped or failed: %s", exc)
@@ -806,6 +959,10 @@ def vision_inspector_node(state: AgentState) -> Dict[str, Any]:
         )
         return {"evidences": {"vision": evidences}}
 
+    if shutdown_requested():
+        logger.warning("VisionInspector: shutdown requested, skipping image extraction.")
+        return {"evidences": {"vision": evidences}}
+
     images = extract_images_from_pdf(pdf_path)
     image_count = len(images)
 
@@ -830,14 +987,11 @@ def vision_inspector_node(state: AgentState) -> Dict[str, Any]:
     llm_available = False
 
     try:
-        import base64
-        from src.llm import get_llm
-        from langchain_core.messages import HumanMessage
-
         vision_llm = get_llm(role="vision", temperature=0.1)
         llm_available = True
         logger.info("VisionInspector: multimodal LLM available, classifying %d images", image_count)
 
+        pending = []  # (image_index, HumanMessage) queued for one batch call
         for i, img_data in enumerate(images[:5]):  # Limit to 5 images
             try:
                 # img_data is a dict with 'image' (bytes) and 'metadata'
@@ -872,12 +1026,7 @@ def vision_inspector_node(state: AgentState) -> Dict[str, Any]:
                         ]
                     )
 
-                    response = vision_llm.invoke([message])
-                    classification_results.append({
-                        "image_index": i,
-                        "classification": response.content,
-                    })
-                    logger.info("VisionInspector: classified image %d", i)
+                    pending.append((i, [message]))
 
             except Exception as img_exc:
                 logger.warning("VisionInspector: failed to classify image %d: %s", i, img_exc)
@@ -886,6 +1035,29 @@ def vision_inspector_node(state: AgentState) -> Dict[str, Any]:
                     "classification": f"Classification failed: {img_exc}",
                 })
 
+        if pending and not shutdown_requested():
+            # One batch call: requests run concurrently on LangChain's executor,
+            # so N diagrams cost about one round-trip instead of N
+            responses = vision_llm.batch(
+                [messages for _, messages in pending],
+                config={"max_concurrency": VISION_MAX_CONCURRENCY},
+                return_exceptions=True,
+            )
+            for (i, _), response in zip(pending, responses):
+                if isinstance(response, Exception):
+                    logger.warning("VisionInspector: failed to classify image %d: %s", i, response)
+                    classification_results.append({
+                        "image_index": i,
+                        "classification": f"Classification failed: {response}",
+                    })
+                else:
+                    classification_results.append({
+                        "image_index": i,
+                        "classification": response.content,
+                    })
+                    logger.info("VisionInspector: classified image %d", i)
+            classification_results.sort(key=lambda r: r["image_index"])
+
     except ImportError:
         logger.info("VisionInspector: multimodal LLM not available, using stub")
     except Exception as exc:
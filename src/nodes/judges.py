@@ -12,19 +12,54 @@ the LLM is forced to return validated JSON, with retry on parse failure.
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any, Dict, List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from src.llm import get_structured_llm
+from src.json_utils import loads as json_loads
+from src.llm import get_llm, get_structured_llm
+from src.shutdown import SHUTDOWN_EVENT
 from src.state import AgentState, Evidence, JudicialOpinion
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 5  # retry on malformed structured output or rate limits
 
+DEFAULT_JUDGE_MAX_CONCURRENCY = 2
+
+
+def _judge_max_concurrency() -> int:
+    """Parse `JUDGE_MAX_CONCURRENCY`; unset means the default.
+
+    Empty, non-integer or non-positive values fall back to the default with
+    a warning instead of failing the import of this module (and the CLI).
+    """
+    raw = os.getenv("JUDGE_MAX_CONCURRENCY")
+    if raw is None:
+        return DEFAULT_JUDGE_MAX_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning(
+            "Ignoring JUDGE_MAX_CONCURRENCY=%r: expected a positive integer; "
+            "using %d.",
+            raw,
+            DEFAULT_JUDGE_MAX_CONCURRENCY,
+        )
+        return DEFAULT_JUDGE_MAX_CONCURRENCY
+    return value
+
+
+# Criteria evaluated concurrently per judge. The three judges already run in
+# parallel, so total in-flight LLM calls = 3 × this. The default of 2 keeps
+# Groq/OpenAI free tiers under their rate limits; raise it on paid tiers.
+JUDGE_MAX_CONCURRENCY = _judge_max_concurrency()
+
 
 # ---------------------------------------------------------------------------
 # System Prompts — COMPLETELY DISTINCT per the rubric requirement
@@ -124,7 +159,40 @@ Be realistic.  Be practical.  Focus on what WORKS and what DOESN'T.
 # ---------------------------------------------------------------------------
 
 
-def _format_evidence_for_prompt(evidences: Dict[str, List[Evidence]]) -> str:
+def _extract_json_object(text: str) -> Optional[str]:
+    """Return the first balanced ``{...}`` span in ``text``, or None.
+
+    Braces inside JSON strings (and escaped quotes) are skipped, so prose
+    before or after the object — including a stray ``}`` — does not leak
+    into the span handed to the parser.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+    return None
+
+
+def format_evidence_for_prompt(evidences: Dict[str, List[Evidence]]) -> str:
     """Flatten all Evidence objects into a structured text block for the LLM."""
     lines = []
     for source_key, evidence_list in evidences.items():
@@ -148,12 +216,19 @@ def _build_criterion_prompt(
     criterion: Dict,
     evidence_text: str,
 ) -> str:
-    """Build the human message for a single rubric criterion."""
+    """Build the human message for a single rubric criterion.
+
+    The shared evidence block comes first and the criterion last, so every
+    call a judge makes starts with the same system + evidence prefix —
+    which providers with prompt caching (OpenAI) and local servers that
+    reuse the KV cache (Ollama) can skip re-processing.
+    """
     # Include target_artifact so the judge knows which evidence source matters most
     target = criterion.get('target_artifact', 'all')
     judicial_logic = criterion.get('judicial_logic', '')
 
     return (
+        f"### Collected Evidence\n{evidence_text}\n\n"
         f"## Criterion: {criterion['name']} (ID: {criterion['id']})\n\n"
         f"### Target Artifact: {target}\n"
         f"Focus your analysis primarily on evidence from the **{target}** source.\n\n"
@@ -161,8 +236,7 @@ def _build_criterion_prompt(
         f"### Judicial Logic\n{judicial_logic or 'Apply your persona guidelines.'}\n\n"
         f"### Success Pattern\n{criterion.get('success_pattern', 'N/A')}\n\n"
         f"### Failure Pattern\n{criterion.get('failure_pattern', 'N/A')}\n\n"
-        f"### Collected Evidence\n{evidence_text}\n\n"
-        f"Based on the evidence above and the success/failure patterns, "
+        f"Based on the collected evidence above and the success/failure patterns, "
         f"render your judicial opinion for this criterion. "
         f"Your score must be an integer from 1 to 5. "
         f"Your argument must cite specific evidence locations. "
@@ -186,19 +260,23 @@ def _run_judge(
     """
     evidences = state.get("evidences", {})
     rubric_dimensions = state.get("rubric_dimensions", [])
-    evidence_text = _format_evidence_for_prompt(evidences)
+    # judge_dispatch renders this once for all three judges; fall back to
+    # formatting here when a judge is invoked outside the graph
+    evidence_text = state.get("evidence_text") or format_evidence_for_prompt(evidences)
 
     # We use both structured and base LLM for robustness
-    from src.llm import get_llm
     base_llm = get_llm(role="judge", temperature=0.1)
     # Note: .with_structured_output is the preferred LangChain way,
     # but we add manual fallback for local models (Ollama) that occasionally fail.
-    structured_llm = base_llm.with_structured_output(JudicialOpinion)
+    # get_structured_llm memoises the bound runnable, so the three judges share it.
+    structured_llm = get_structured_llm(JudicialOpinion, role="judge", temperature=0.1)
 
     def _judge_single_criterion(idx_criterion):
         """Evaluate a single rubric criterion. Thread-safe."""
         idx, criterion = idx_criterion
         criterion_id = criterion.get("id", "unknown")
+        if SHUTDOWN_EVENT.is_set():
+            return None  # aborted audit — filtered out below
         try:
             logger.info("%s starting analysis of '%s' (%d/%d)",
                         judge_name, criterion_id, idx, len(rubric_dimensions))
@@ -221,7 +299,6 @@ def _run_judge(
                 HumanMessage(content=criterion_prompt),
             ]
 
-            import time
             backoff = 2.0  # start with 2s backoff (rate limits need longer)
 
             # Retry loop for structured output parsing failures AND rate limits
@@ -250,7 +327,8 @@ def _run_judge(
                         if attempt < MAX_RETRIES:
                             logger.info("%s rate limited on '%s' (attempt %d/%d). Backing off %.1fs...",
                                         judge_name, criterion_id, attempt, MAX_RETRIES, backoff)
-                            time.sleep(backoff)
+                            if SHUTDOWN_EVENT.wait(backoff):
+                                return None
                             backoff *= 2.0
                             continue
                         else:
@@ -271,13 +349,10 @@ def _run_judge(
                         raw_response = base_llm.invoke(messages)
                         content = raw_response.content
 
-                        import json
-                        import re
-
-                        # Look for { ... } anywhere in the string
-                        json_match = re.search(r"(\{.*\})", content, re.DOTALL)
-                        if json_match:
-                            raw_json = json.loads(json_match.group(1))
+                        # Take the first complete { ... } object in the reply
+                        json_text = _extract_json_object(content)
+                        if json_text:
+                            raw_json = json_loads(json_text)
                             opinion = JudicialOpinion(
                                 judge=judge_name,
                                 criterion_id=criterion["id"],
@@ -302,7 +377,8 @@ def _run_judge(
                     else:
                         # Exponential backoff before retry
                         logger.info("%s backing off for %.1fs before retry...", judge_name, backoff)
-                        time.sleep(backoff)
+                        if SHUTDOWN_EVENT.wait(backoff):
+                            return None
                         backoff *= 2.0
         except Exception as fatal_exc:
             logger.error("%s encountered a fatal error while processing '%s': %s",
@@ -315,18 +391,14 @@ def _run_judge(
                 cited_evidence=[],
             )
 
-    # Run all criteria in parallel using ThreadPoolExecutor
-    # NOTE: max_workers=2 because 3 judges run in LangGraph parallel,
-    # so total concurrent calls = 3 judges × 2 workers = 6 max.
-    # Higher parallelism causes 429 rate limits on Groq/OpenAI free tiers.
-    from concurrent.futures import ThreadPoolExecutor
+    # Run all criteria in parallel using ThreadPoolExecutor, capped at
+    # JUDGE_MAX_CONCURRENCY (see above) to stay clear of 429 rate limits.
     indexed_criteria = list(enumerate(rubric_dimensions, 1))
-    # with ThreadPoolExecutor(max_workers=min(len(indexed_criteria), 10)) as executor:
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
+    with ThreadPoolExecutor(max_workers=JUDGE_MAX_CONCURRENCY) as executor:
         opinions = list(executor.map(_judge_single_criterion, indexed_criteria))
 
-    # Filter out any None results (shouldn't happen but defensive)
+    # Filter out any None results (criteria skipped after a shutdown request)
     opinions = [o for o in opinions if o is not None]
 
     logger.info("%s completed with %d opinions.", judge_name, len(opinions))
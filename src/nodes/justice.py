@@ -25,6 +25,7 @@ from typing import Any, Dict, List, Optional
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.llm import get_llm
+from src.shutdown import shutdown_requested
 from src.state import (
     AgentState,
     AuditReport,
@@ -47,9 +48,27 @@ SECURITY_VIOLATION_MARKERS = [
     "unsanitized",
 ]
 
+# Goal terms that mark an evidence item as security-related
+SECURITY_GOAL_TERMS = ("os.system", "security", "shell injection", "sandbox")
+
 # Architecture criterion IDs where TechLead carries highest weight
 ARCHITECTURE_CRITERIA = {"graph_orchestration", "state_management_rigor"}
 
+# Additional keyword mappings for common criterion topics — built once at
+# import rather than on every _evidence_supports_claim call
+CRITERION_KEYWORD_MAP = {
+    "git": frozenset(["commit", "git", "history", "log", "progression"]),
+    "state": frozenset(["state", "pydantic", "typeddict", "reducer", "basemodel", "agentstate"]),
+    "graph": frozenset(["graph", "stategraph", "edge", "node", "fan-out", "fan-in", "parallel"]),
+    "safe": frozenset(["sandbox", "tempfile", "subprocess", "clone", "security"]),
+    "structured": frozenset(["structured", "json", "pydantic", "with_structured_output", "bind_tools"]),
+    "judicial": frozenset(["judge", "prosecutor", "defense", "techlead", "persona"]),
+    "chief": frozenset(["chief", "justice", "synthesis", "conflict", "resolution"]),
+    "theoretical": frozenset(["dialectical", "metacognition", "fan-in", "fan-out", "synchronization"]),
+    "report": frozenset(["report", "pdf", "file", "path", "cross-reference"]),
+    "swarm": frozenset(["diagram", "visual", "architecture", "image"]),
+}
+
 
 # ---------------------------------------------------------------------------
 # Deterministic conflict resolution
@@ -66,10 +85,9 @@ def _has_security_violation(evidences: Dict[str, List[Evidence]]) -> bool:
     for source, evidence_list in evidences.items():
         for ev in evidence_list:
             # Only flag evidence items that are security-related AND negative
-            is_security_goal = any(
-                term in (ev.goal or "").lower()
-                for term in ["os.system", "security", "shell injection", "sandbox"]
-            )
+            # Lower-case the goal once per item, not once per term
+            goal_tag = ev.goal_tag
+            is_security_goal = any(term in goal_tag for term in SECURITY_GOAL_TERMS)
 
             if is_security_goal and not ev.found:
                 # Evidence confirms a security failure was detected
@@ -94,25 +112,11 @@ def _evidence_supports_claim(
     # e.g. "git_forensic_analysis" -> ["git", "forensic", "analysis", "commit"]
     base_terms = criterion_id.replace("_", " ").lower().split()
 
-    # Additional keyword mappings for common criterion topics
-    KEYWORD_MAP = {
-        "git": ["commit", "git", "history", "log", "progression"],
-        "state": ["state", "pydantic", "typeddict", "reducer", "basemodel", "agentstate"],
-        "graph": ["graph", "stategraph", "edge", "node", "fan-out", "fan-in", "parallel"],
-        "safe": ["sandbox", "tempfile", "subprocess", "clone", "security"],
-        "structured": ["structured", "json", "pydantic", "with_structured_output", "bind_tools"],
-        "judicial": ["judge", "prosecutor", "defense", "techlead", "persona"],
-        "chief": ["chief", "justice", "synthesis", "conflict", "resolution"],
-        "theoretical": ["dialectical", "metacognition", "fan-in", "fan-out", "synchronization"],
-        "report": ["report", "pdf", "file", "path", "cross-reference"],
-        "swarm": ["diagram", "visual", "architecture", "image"],
-    }
-
     # Expand search terms with mapped keywords
     search_terms = set(base_terms)
     for term in base_terms:
-        if term in KEYWORD_MAP:
-            search_terms.update(KEYWORD_MAP[term])
+        if term in CRITERION_KEYWORD_MAP:
+            search_terms.update(CRITERION_KEYWORD_MAP[term])
 
     for source, evidence_list in evidences.items():
         for ev in evidence_list:
@@ -364,6 +368,11 @@ def chief_justice_node(state: AgentState) -> Dict[str, Any]:
       4. Dissent Requirement  — variance > 2 mandates dissent summary
       5. Variance Re-evaluation — re-weights towards median on high variance
     """
+    if shutdown_requested():
+        # Judges skipped criteria after the Ctrl+C, so any verdict built
+        # from the partial opinions would be fabricated — produce none
+        return {"error": "Audit aborted by user (Ctrl+C)."}
+
     logger.info("=== CHIEF JUSTICE entering deliberation ===")
 
     repo_url = state.get("repo_url", "unknown")
@@ -422,6 +431,8 @@ def chief_justice_node(state: AgentState) -> Dict[str, Any]:
     # Generate narrative sections via LLM
     executive_summary = _generate_executive_summary(criteria_results, repo_url)
     remediation_plan = _generate_remediation_plan(criteria_results)
+    if shutdown_requested():
+        return {"error": "Audit aborted by user (Ctrl+C)."}
 
     # Build the final AuditReport
     report = AuditReport(
@@ -0,0 +1,21 @@
+"""
+shutdown.py — Cooperative cancellation for the Automaton Auditor swarm.
+
+main.py sets SHUTDOWN_EVENT on the first Ctrl+C.  Nodes poll it before
+starting expensive work (git clone, PDF parsing, LLM calls) so an aborted
+audit stops scheduling new work, still runs its ``finally`` clean-up
+(temporary clones) and returns whatever it has.  A second Ctrl+C, or the
+grace period running out, hard-kills the process as before.
+
+Kept free of heavy imports so the CLI can install its signal handler
+before anything else is loaded.
+"""
+
+import threading
+
+SHUTDOWN_EVENT = threading.Event()
+
+
+def shutdown_requested() -> bool:
+    """Return True once the user has asked the audit to stop."""
+    return SHUTDOWN_EVENT.is_set()
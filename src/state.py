@@ -39,6 +39,16 @@ class Evidence(BaseModel):
         description="0.0 = artifact not found / unverifiable, 1.0 = irrefutable evidence",
     )
 
+    @property
+    def goal_tag(self) -> str:
+        """Lower-cased ``goal`` used for keyword classification.
+
+        Not cached: it is derived on each access so it always tracks
+        ``goal``, including on ``model_copy(update=...)`` copies and after
+        assignment.  Callers testing several terms bind it once per item.
+        """
+        return self.goal.lower()
+
 
 class JudicialOpinion(BaseModel):
     """
@@ -103,6 +113,14 @@ class AgentState(TypedDict):
     # Parallel-safe: dict merge — each detective writes under its own key
     evidences: Annotated[Dict[str, List[Evidence]], operator.ior]
 
+    # Running total of evidence items — summed once at the fan-in so later
+    # nodes can read the count instead of re-walking `evidences`
+    evidence_count: Annotated[int, operator.add]
+
+    # Evidence rendered as prompt text — written once by judge_dispatch and
+    # shared by the three judges so their criterion prompts are identical
+    evidence_text: str
+
     # Parallel-safe: list append — each judge appends its opinions
     opinions: Annotated[List[JudicialOpinion], operator.add]
 
@@ -1,7 +1,7 @@
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +31,10 @@ def ingest_pdf(pdf_path: str) -> Dict[str, Any]:
             for i, page in enumerate(pdf.pages):
                 text = page.extract_text() or ""
                 pages_text.append((i + 1, text))
+                # Drop the page's cached layout objects once its text is out —
+                # otherwise every page's chars/words stay alive until the
+                # PDF closes, which dominates peak memory on long reports
+                page.close()
 
         full_text = "\n\n".join(text for _, text in pages_text)
         result["full_text"] = full_text
@@ -146,10 +150,31 @@ FORENSIC_CONCEPTS = {
 }
 
 
+# Phrases that signal the author is explaining a concept, not just naming it.
+# Checked only within the top-scoring chunks of each concept.
+EXPLANATION_MARKERS = (
+    "because",
+    "implemented",
+    "achieved",
+    "works by",
+    "by using",
+    "this means",
+    "specifically",
+    "the reason",
+    "which means",
+    "in order to",
+    "this is how",
+    "the way",
+    "via the",
+    "through the",
+)
+
+
 def query_pdf_for_concept(
     ingested: Dict[str, Any],
     concept_key: str,
     top_k: int = 3,
+    lowered_texts: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
 
     keywords = FORENSIC_CONCEPTS.get(concept_key, [concept_key.replace("_", " ")])
@@ -169,28 +194,37 @@ def query_pdf_for_concept(
     if ingested.get("error") or not ingested.get("chunks"):
         return result
 
-    # Score each chunk: count how many distinct keywords appear in it
-    scored = []
-    for chunk in ingested["chunks"]:
-        text_lower = chunk["text"].lower()
+    # Score each chunk: count how many distinct keywords appear in it.
+    # Callers scanning several concepts pass the lower-cased texts in so
+    # every chunk is case-folded once, not once per concept.
+    if lowered_texts is None:
+        lowered_texts = [chunk["text"].lower() for chunk in ingested["chunks"]]
+    # (scored chunk, its lowered text) — the lowered text is reused by the
+    # explanation-marker check below instead of lower-casing the chunk again
+    ranked = []
+    for chunk, text_lower in zip(ingested["chunks"], lowered_texts):
         raw_hits = sum(1 for kw in keywords if kw in text_lower)
         if raw_hits > 0:
-            scored.append(
-                {
-                    **chunk,
-                    "raw_keyword_hits": raw_hits,
-                    "normalised_score": round(raw_hits / total_keywords, 3),
-                }
+            ranked.append(
+                (
+                    {
+                        **chunk,
+                        "raw_keyword_hits": raw_hits,
+                        "normalised_score": round(raw_hits / total_keywords, 3),
+                    },
+                    text_lower,
+                )
             )
 
-    if not scored:
+    if not ranked:
         return result
 
+    ranked.sort(key=lambda pair: pair[0]["raw_keyword_hits"], reverse=True)
+    scored = [entry for entry, _ in ranked]
+
     result["found"] = True
     result["chunks_with_hits"] = len(scored)
     result["max_page_with_hit"] = max(c["page"] for c in scored)
-
-    scored.sort(key=lambda x: x["raw_keyword_hits"], reverse=True)
     result["top_chunks"] = scored[:top_k]
 
     # Keyword drop warning: every hit is on page 1 — exec summary only.
@@ -204,27 +238,10 @@ def query_pdf_for_concept(
     # SAME chunk — not just somewhere in the document.
     # A generic word like "how" on a different page from the concept does not
     # indicate an explanation of the concept.
-    explanation_markers = [
-        "because",
-        "implemented",
-        "achieved",
-        "works by",
-        "by using",
-        "this means",
-        "specifically",
-        "the reason",
-        "which means",
-        "in order to",
-        "this is how",
-        "the way",
-        "via the",
-        "through the",
-    ]
-    for chunk in scored[:top_k]:
-        text_lower = chunk["text"].lower()
+    for _, text_lower in ranked[:top_k]:
         # Concept keyword is already confirmed present (chunk is in scored).
         # Now check if an explanatory marker also appears in this same chunk.
-        if any(marker in text_lower for marker in explanation_markers):
+        if any(marker in text_lower for marker in EXPLANATION_MARKERS):
             result["substantive_explanation"] = True
             break
 
@@ -236,12 +253,21 @@ def verify_all_forensic_concepts(ingested: Dict[str, Any]) -> Dict[str, Any]:
     Run concept verification for all four rubric-required forensic concepts.
     Returns a combined report for the DocAnalyst Evidence output.
     """
+    lowered_texts = [chunk["text"].lower() for chunk in ingested.get("chunks") or []]
     return {
-        concept: query_pdf_for_concept(ingested, concept)
+        concept: query_pdf_for_concept(ingested, concept, lowered_texts=lowered_texts)
         for concept in FORENSIC_CONCEPTS
     }
 
 
+# File-path shapes claimed in report text, compiled once at import
+FILE_PATH_PATTERNS = (
+    re.compile(r"`?(src/[a-zA-Z0-9_/]+\.(?:py|toml|md|json|txt))`?"),
+    re.compile(r"`?([a-zA-Z0-9_]+\.(?:toml|md|json|txt|env))`?"),
+    re.compile(r"`?(\.env[a-zA-Z0-9._]*)`?"),
+)
+
+
 def extract_file_paths_from_text(text: str) -> List[str]:
     """
     Extract all file paths mentioned in the PDF text.
@@ -255,15 +281,10 @@ def extract_file_paths_from_text(text: str) -> List[str]:
     - README.md
     - rubric.json
     """
-    patterns = [
-        r"`?(src/[a-zA-Z0-9_/]+\.(?:py|toml|md|json|txt))`?",
-        r"`?([a-zA-Z0-9_]+\.(?:toml|md|json|txt|env))`?",
-        r"`?(\.env[a-zA-Z0-9._]*)`?",
-    ]
+    # A set: a path cited many times is returned (and cross-referenced) once
     found = set()
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        found.update(matches)
+    for pattern in FILE_PATH_PATTERNS:
+        found.update(pattern.findall(text))
 
     # Clean up and filter noise
     cleaned = []
@@ -275,24 +296,44 @@ def extract_file_paths_from_text(text: str) -> List[str]:
     return sorted(cleaned)
 
 
+def normalize_path(path: str) -> str:
+    """Canonicalise a cited path: POSIX separators, no leading "./"."""
+    path = path.strip().replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    return path
+
+
+def build_path_suffix_index(paths: Iterable[str]) -> Set[str]:
+    """
+    Index every trailing path-segment suffix of each path, e.g.
+    "src/nodes/judges.py" -> {"src/nodes/judges.py", "nodes/judges.py", "judges.py"}.
+
+    A cited path is then verified with a single set lookup instead of a
+    substring scan over the whole manifest.
+    """
+    index: Set[str] = set()
+    for path in paths:
+        parts = normalize_path(path).split("/")
+        for i in range(len(parts)):
+            index.add("/".join(parts[i:]))
+    return index
+
+
 def cross_reference_paths(
     claimed_paths: List[str],
     repo_file_manifest: List[str],
 ) -> Dict[str, Any]:
 
-    manifest_set = set(repo_file_manifest)
-
-    # Normalize: strip leading "./" if present
-    def normalize(p: str) -> str:
-        return p.lstrip("./").strip()
+    # Every trailing segment suffix of every manifest path: a claim matches
+    # exactly or as a relative tail ("nodes/judges.py") with one set lookup
+    manifest_suffixes = build_path_suffix_index(repo_file_manifest)
 
     verified = []
     hallucinated = []
 
     for path in claimed_paths:
-        norm = normalize(path)
-        # Check exact match and partial match (report may use relative paths)
-        if norm in manifest_set or any(norm in m for m in manifest_set):
+        if normalize_path(path) in manifest_suffixes:
             verified.append(path)
         else:
             hallucinated.append(path)
@@ -325,6 +366,36 @@ def extract_images_from_pdf(pdf_path: str) -> List[Dict[str, Any]]:
         logger.warning("PDF not found for image extraction: %s", pdf_path)
         return images
 
+    # Actual image bytes via pypdf first — when it finds images, the
+    # pdfplumber metadata pass would be discarded anyway, so skip it
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(str(pdf_path))
+        for page_num, page in enumerate(reader.pages, start=1):
+            for img_index, img_ref in enumerate(page.images):
+                images.append(
+                    {
+                        "page": page_num,
+                        "index": img_index,
+                        "image_bytes": img_ref.data,
+                        "format": (
+                            img_ref.name.split(".")[-1]
+                            if "." in img_ref.name
+                            else "png"
+                        ),
+                    }
+                )
+
+    except Exception as exc:
+        logger.warning("pypdf image byte extraction failed: %s", exc)
+        images = []
+
+    if images:
+        logger.info("Extracted %d images from PDF", len(images))
+        return images
+
+    # Fallback: image metadata only (no bytes) via pdfplumber
     try:
         import pdfplumber
 
@@ -332,7 +403,7 @@ def extract_images_from_pdf(pdf_path: str) -> List[Dict[str, Any]]:
             for page_num, page in enumerate(pdf.pages, start=1):
                 for img_index, img in enumerate(page.images):
                     try:
-                        # pdfplumber returns image metadata; use pypdf for bytes
+                        # pdfplumber returns image metadata only
                         images.append(
                             {
                                 "page": page_num,
@@ -341,41 +412,16 @@ def extract_images_from_pdf(pdf_path: str) -> List[Dict[str, Any]]:
                                 "y0": img.get("y0"),
                                 "width": img.get("width"),
                                 "height": img.get("height"),
-                                "image_bytes": None,  # Populated below if pypdf available
+                                "image_bytes": None,  # pypdf could not supply bytes
                                 "format": "unknown",
                             }
                         )
                     except Exception:
                         pass
+                page.close()  # release cached layout objects, as in ingest_pdf
 
     except Exception as exc:
         logger.warning("pdfplumber image extraction failed: %s", exc)
 
-    # Try to get actual image bytes via pypdf
-    try:
-        from pypdf import PdfReader
-
-        reader = PdfReader(str(pdf_path))
-        byte_images = []
-        for page_num, page in enumerate(reader.pages, start=1):
-            for img_index, img_ref in enumerate(page.images):
-                byte_images.append(
-                    {
-                        "page": page_num,
-                        "index": img_index,
-                        "image_bytes": img_ref.data,
-                        "format": (
-                            img_ref.name.split(".")[-1]
-                            if "." in img_ref.name
-                            else "png"
-                        ),
-                    }
-                )
-        if byte_images:
-            images = byte_images
-
-    except Exception as exc:
-        logger.warning("pypdf image byte extraction failed: %s", exc)
-
     logger.info("Extracted %d images from PDF", len(images))
     return images
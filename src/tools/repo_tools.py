@@ -1,10 +1,12 @@
 import ast
+import functools
 import logging
+import os
 import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -39,78 +41,95 @@ def clone_repo_sandboxed(repo_url: str) -> Tuple[str, Optional[str]]:
         return None, f"Unexpected clone error: {exc}"
 
 
+def resolve_head_commit(repo: str) -> Optional[str]:
+    """
+    Return the HEAD commit SHA of a remote URL or local clone, or None.
+    Uses `git ls-remote`, so a remote is queried without cloning it.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-remote", repo, "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
+        logger.debug("ls-remote failed for %s: %s", repo, exc)
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout.split()[0]
+
+
 def cleanup_repo(tmp_dir: str) -> None:
     """Remove the sandboxed clone directory after analysis is complete."""
     shutil.rmtree(tmp_dir, ignore_errors=True)
     logger.debug("Cleaned up sandbox: %s", tmp_dir)
 
 
+# Progression keywords mapped to expected phases
+PHASE_KEYWORDS = {
+    "setup": ("init", "setup", "environment", "scaffold", "structure", "config"),
+    "tooling": ("tool", "ast", "parse", "git", "clone", "pdf", "doc", "ingest"),
+    "orchestration": (
+        "graph",
+        "node",
+        "langgraph",
+        "state",
+        "detective",
+        "agent",
+        "swarm",
+    ),
+}
+
+
 def extract_git_history(repo_path: str) -> Dict[str, Any]:
 
     result = subprocess.run(
-        ["git", "log", "--oneline", "--reverse", "--format=%H|||%s|||%ci"],
+        ["git", "log", "--reverse", "-z", "--format=%H%x00%s%x00%ci%x00%ct"],
         cwd=repo_path,
         capture_output=True,
         text=True,
         timeout=30,
     )
 
+    # -z terminates each commit with NUL and %x00 separates its fields, so
+    # the output is one flat NUL-separated stream, four fields per commit.
+    # NUL cannot occur in a subject, unlike the old "|||" delimiter.
+    fields = result.stdout.split("\0")
     commits = []
-    for line in result.stdout.strip().splitlines():
-        if "|||" not in line:
+    commit_times = []  # Unix epoch seconds (%ct) — no date parsing needed
+    for i in range(0, len(fields) - 3, 4):
+        commit_hash, message, timestamp, epoch = fields[i : i + 4]
+        if not epoch.isdigit():
             continue
-        parts = line.split("|||")
-        if len(parts) == 3:
-            commits.append(
-                {
-                    "hash": parts[0].strip(),
-                    "message": parts[1].strip(),
-                    "timestamp": parts[2].strip(),
-                }
-            )
+        commits.append(
+            {
+                "hash": commit_hash.strip(),
+                "message": message.strip(),
+                "timestamp": timestamp.strip(),
+            }
+        )
+        commit_times.append(int(epoch))
 
     total = len(commits)
 
-    # Progression keywords mapped to expected phases
-    phase_keywords = {
-        "setup": ["init", "setup", "environment", "scaffold", "structure", "config"],
-        "tooling": ["tool", "ast", "parse", "git", "clone", "pdf", "doc", "ingest"],
-        "orchestration": [
-            "graph",
-            "node",
-            "langgraph",
-            "state",
-            "detective",
-            "agent",
-            "swarm",
-        ],
-    }
-
-    phases_found = {phase: False for phase in phase_keywords}
+    phases_found = {phase: False for phase in PHASE_KEYWORDS}
     for commit in commits:
         msg_lower = commit["message"].lower()
-        for phase, keywords in phase_keywords.items():
-            if any(kw in msg_lower for kw in keywords):
+        for phase, keywords in PHASE_KEYWORDS.items():
+            if not phases_found[phase] and any(kw in msg_lower for kw in keywords):
                 phases_found[phase] = True
+        if all(phases_found.values()):
+            break  # every phase already evidenced — later commits can't change it
 
     progression_detected = sum(phases_found.values()) >= 2
 
     # Bulk upload detection: all commits within 5 minutes of each other
     bulk_upload_flag = False
     if total > 1:
-        try:
-            from datetime import datetime
-
-            timestamps = []
-            for c in commits:
-                # Parse ISO 8601 with timezone offset
-                ts_str = c["timestamp"][:19]  # "2024-01-15 10:30:00"
-                timestamps.append(datetime.fromisoformat(ts_str))
-            if timestamps:
-                span_seconds = (max(timestamps) - min(timestamps)).total_seconds()
-                bulk_upload_flag = span_seconds < 300 and total > 3
-        except Exception:
-            pass
+        span_seconds = max(commit_times) - min(commit_times)
+        bulk_upload_flag = span_seconds < 300 and total > 3
 
     # Build narrative summary
     if total == 0:
@@ -134,15 +153,38 @@ def extract_git_history(repo_path: str) -> Dict[str, Any]:
     }
 
 
+# Directories that never hold the submission's own source: git's object
+# store, virtualenvs, caches and vendored JS dependencies
+PRUNED_DIRS = frozenset(
+    {".git", ".venv", "venv", "__pycache__", "node_modules", ".mypy_cache", ".tox"}
+)
+
+
+def _iter_repo_files(root: Path) -> Iterator[Path]:
+    """
+    Yield every file under *root*, pruning PRUNED_DIRS.
+    Pruning during the walk means git's object store or a committed
+    virtualenv is never descended into, unlike rglob() followed by a filter.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in PRUNED_DIRS]
+        for name in filenames:
+            yield Path(dirpath, name)
+
+
+def _iter_python_files(root: Path) -> Iterator[Path]:
+    """Yield every .py file under *root*, pruning PRUNED_DIRS."""
+    return (p for p in _iter_repo_files(root) if p.suffix == ".py")
+
+
 def list_repo_files(repo_path: str) -> List[str]:
     """
-    Return all Python file paths in the repo relative to the root.
-    Used by the RepoInvestigator to build a manifest before targeted scanning.
+    Return every file path in the repo relative to the root, '/'-separated.
+    Used by the RepoInvestigator to build the manifest that the paths cited
+    in the PDF report are cross-referenced against.
     """
     root = Path(repo_path)
-    return [
-        str(p.relative_to(root)) for p in root.rglob("*.py") if ".git" not in p.parts
-    ]
+    return sorted(p.relative_to(root).as_posix() for p in _iter_repo_files(root))
 
 
 def file_exists(repo_path: str, relative_path: str) -> bool:
@@ -157,15 +199,71 @@ def read_file(repo_path: str, relative_path: str) -> Optional[str]:
     Never executes, imports, or evals the content.
     """
     target = Path(repo_path) / relative_path
-    if not target.exists():
-        return None
     try:
+        # EAFP: a missing file costs the failed open, not an extra stat()
         return target.read_text(encoding="utf-8", errors="replace")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
     except Exception as exc:
         logger.warning("Could not read %s: %s", relative_path, exc)
         return None
 
 
+# Sized to hold a typical submission's .py files — the security scan walks
+# every one of them and must not evict the files the analysers re-read
+@functools.lru_cache(maxsize=64)
+def _parse_python(
+    file_path: str, mtime_ns: int, size: int
+) -> Tuple[str, Optional[ast.Module], Optional[SyntaxError]]:
+    source = Path(file_path).read_text(encoding="utf-8", errors="replace")
+    try:
+        return source, ast.parse(source), None
+    except SyntaxError as exc:
+        return source, None, exc
+
+
+def parse_python_file(
+    file_path: str,
+) -> Tuple[str, Optional[ast.Module], Optional[SyntaxError]]:
+    """
+    Read and AST-parse a file once per (path, mtime, size).
+    Returns (source, tree, None) or (source, None, SyntaxError).
+    The analysers and the security scan share this, so each file in a
+    clone is parsed once however many checks read it. Trees are shared —
+    read-only.
+    """
+    st = os.stat(file_path)
+    return _parse_python(file_path, st.st_mtime_ns, st.st_size)
+
+
+def _has_operator_reducer(node: ast.Subscript) -> bool:
+    """True if the subscript contains an `operator.ior` / `operator.add` reference.
+
+    A structural match on the subtree — cheaper than `ast.unparse()`-ing
+    every subscript in the file and searching the rebuilt source text.
+    """
+    return any(
+        isinstance(child, ast.Attribute)
+        and child.attr in ("ior", "add")
+        and isinstance(child.value, ast.Name)
+        and child.value.id == "operator"
+        for child in ast.walk(node)
+    )
+
+
+def _edge_endpoint(arg: ast.expr) -> str:
+    """Render an add_edge() argument as source text, as `ast.unparse` would.
+
+    Node names are almost always string literals or bare names (START, END),
+    so those skip the unparser; anything else falls back to it.
+    """
+    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        return repr(arg.value)
+    if isinstance(arg, ast.Name):
+        return arg.id
+    return ast.unparse(arg)
+
+
 def analyze_graph_structure(file_path: str) -> Dict[str, Any]:
     """
     Parse a Python file with Python's ast module and extract structural facts
@@ -196,11 +294,8 @@ def analyze_graph_structure(file_path: str) -> Dict[str, Any]:
         "parse_error": None,
     }
 
-    source = Path(file_path).read_text(encoding="utf-8", errors="replace")
-
-    try:
-        tree = ast.parse(source)
-    except SyntaxError as exc:
+    _, tree, exc = parse_python_file(file_path)
+    if exc is not None:
         result["parse_error"] = f"SyntaxError at line {exc.lineno}: {exc.msg}"
         return result
 
@@ -214,8 +309,8 @@ def analyze_graph_structure(file_path: str) -> Dict[str, Any]:
             if isinstance(func, ast.Attribute):
                 if func.attr == "add_edge" and len(node.args) == 2:
                     try:
-                        from_node = ast.unparse(node.args[0])
-                        to_node = ast.unparse(node.args[1])
+                        from_node = _edge_endpoint(node.args[0])
+                        to_node = _edge_endpoint(node.args[1])
                         result["add_edge_calls"].append((from_node, to_node))
                     except Exception:
                         pass
@@ -235,13 +330,8 @@ def analyze_graph_structure(file_path: str) -> Dict[str, Any]:
                     result["pydantic_models"].append(node.name)
 
         # Looks for: Annotated[..., operator.ior] or Annotated[..., operator.add]
-        if isinstance(node, ast.Subscript):
-            try:
-                unparsed = ast.unparse(node)
-                if "operator.ior" in unparsed or "operator.add" in unparsed:
-                    result["has_reducers"] = True
-            except Exception:
-                pass
+        if not result["has_reducers"] and isinstance(node, ast.Subscript):
+            result["has_reducers"] = _has_operator_reducer(node)
 
     # Fan-out: same source node in multiple add_edge calls
     sources = [edge[0] for edge in result["add_edge_calls"]]
@@ -274,11 +364,8 @@ def analyze_state_schema(file_path: str) -> Dict[str, Any]:
         "parse_error": None,
     }
 
-    source = Path(file_path).read_text(encoding="utf-8", errors="replace")
-
-    try:
-        tree = ast.parse(source)
-    except SyntaxError as exc:
+    source, tree, exc = parse_python_file(file_path)
+    if exc is not None:
         result["parse_error"] = f"SyntaxError: {exc.msg} at line {exc.lineno}"
         return result
 
@@ -308,13 +395,8 @@ def analyze_state_schema(file_path: str) -> Dict[str, Any]:
                 end = node.end_lineno
                 result["code_snippet"] = "\n".join(lines[start:end])
 
-        if isinstance(node, ast.Subscript):
-            try:
-                unparsed = ast.unparse(node)
-                if "operator.ior" in unparsed or "operator.add" in unparsed:
-                    result["has_reducers"] = True
-            except Exception:
-                pass
+        if not result["has_reducers"] and isinstance(node, ast.Subscript):
+            result["has_reducers"] = _has_operator_reducer(node)
 
     return result
 
@@ -324,13 +406,11 @@ def scan_for_security_violations(repo_path: str) -> List[Dict[str, str]]:
     violations = []
     root = Path(repo_path)
 
-    for py_file in root.rglob("*.py"):
-        if ".git" in py_file.parts:
-            continue
-        source = py_file.read_text(encoding="utf-8", errors="replace")
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
+    for py_file in _iter_python_files(root):
+        # Shares the parse cache with the graph/state analysers and the
+        # justice.py check, so each file in the clone is parsed once
+        _, tree, _ = parse_python_file(str(py_file))
+        if tree is None:
             continue
 
         rel_path = str(py_file.relative_to(root))
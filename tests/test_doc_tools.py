@@ -0,0 +1,74 @@
+"""
+Unit tests for src/tools/doc_tools.py.
+
+Run from the repository root with ``pytest -q``.
+"""
+
+from src.tools.doc_tools import (
+    build_path_suffix_index,
+    cross_reference_paths,
+    normalize_path,
+)
+
+
+# ---------------------------------------------------------------------------
+# PDF path cross-referencing — normalize_path / build_path_suffix_index
+# ---------------------------------------------------------------------------
+
+
+def test_normalize_path():
+    assert normalize_path("./src/graph.py") == "src/graph.py"
+    assert normalize_path("././src/graph.py") == "src/graph.py"
+    assert normalize_path("src\\nodes\\judges.py") == "src/nodes/judges.py"
+    assert normalize_path("  .\\src\\state.py ") == "src/state.py"
+    # Only a leading "./" is stripped — dotfiles keep their dot
+    assert normalize_path(".env.example") == ".env.example"
+    assert normalize_path("./.env.example") == ".env.example"
+
+
+def test_build_path_suffix_index():
+    index = build_path_suffix_index(["src/nodes/judges.py", ".\\.env.example"])
+    assert index == {
+        "src/nodes/judges.py",
+        "nodes/judges.py",
+        "judges.py",
+        ".env.example",
+    }
+
+
+def test_cross_reference_paths_matches_whole_segments_only():
+    manifest = [
+        "src/nodes/judges.py",
+        "src/state.py",
+        ".env.example",
+        "rubric/rubric.json",
+    ]
+    result = cross_reference_paths(
+        [
+            "./src/nodes/judges.py",
+            "src\\state.py",
+            "nodes/judges.py",
+            ".env.example",
+            "rubric.json",
+            "env.example",  # tail of a segment, not a whole segment
+            "tate.py",
+            "src/missing.py",
+        ],
+        manifest,
+    )
+    assert result["verified"] == [
+        "./src/nodes/judges.py",
+        "src\\state.py",
+        "nodes/judges.py",
+        ".env.example",
+        "rubric.json",
+    ]
+    assert result["hallucinated"] == ["env.example", "tate.py", "src/missing.py"]
+    assert result["hallucination_count"] == 3
+    assert result["accuracy_score"] == round(5 / 8, 2)
+
+
+def test_cross_reference_paths_with_no_claims():
+    result = cross_reference_paths([], ["src/state.py"])
+    assert result["verified"] == [] and result["hallucinated"] == []
+    assert result["accuracy_score"] == 1.0
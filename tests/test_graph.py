@@ -0,0 +1,114 @@
+"""
+Unit tests for src/graph.py — the evidence aggregator's cross-reference.
+
+Run from the repository root with ``pytest -q``.
+"""
+
+import pytest
+
+import src.graph as graph
+from src.nodes.detectives import PDF_CITED_PATHS_GOAL, REPO_MANIFEST_GOAL
+from src.shutdown import SHUTDOWN_EVENT
+from src.state import Evidence
+
+
+def _evidence(goal, content=None, found=True, location="x"):
+    return Evidence(
+        goal=goal,
+        found=found,
+        content=content,
+        location=location,
+        rationale="test",
+        confidence=1.0,
+    )
+
+
+def _manifest(*paths):
+    return _evidence(REPO_MANIFEST_GOAL, content="\n".join(paths), location="repo")
+
+
+@pytest.fixture(autouse=True)
+def _clear_shutdown():
+    SHUTDOWN_EVENT.clear()
+    yield
+    SHUTDOWN_EVENT.clear()
+
+
+# ---------------------------------------------------------------------------
+# evidence_aggregator
+# ---------------------------------------------------------------------------
+
+
+def test_aggregator_errors_without_evidence():
+    assert graph.evidence_aggregator({"evidences": {}}) == {
+        "error": "No evidence collected from any detective."
+    }
+
+
+def test_aggregator_errors_on_shutdown():
+    SHUTDOWN_EVENT.set()
+    result = graph.evidence_aggregator({"evidences": {"repo": [_manifest("a/b.py")]}})
+    assert result == {"error": "Audit aborted by user (Ctrl+C)."}
+
+
+@pytest.mark.parametrize(
+    "doc_evidence",
+    [
+        [],
+        [_evidence(PDF_CITED_PATHS_GOAL, found=False)],
+        [_evidence("Verify substantive explanation of 'x' in PDF", content="src/a.py")],
+    ],
+    ids=["no-doc-evidence", "no-paths-cited", "other-doc-goals"],
+)
+def test_aggregator_fast_path_skips_the_manifest(monkeypatch, doc_evidence):
+    def fail(_paths):
+        raise AssertionError("manifest should not be indexed")
+
+    monkeypatch.setattr(graph, "build_path_suffix_index", fail)
+    state = {"evidences": {"repo": [_manifest("src/graph.py")], "doc": doc_evidence}}
+    assert graph.evidence_aggregator(state) == {"evidence_count": 1 + len(doc_evidence)}
+
+
+def test_aggregator_verifies_cited_paths_against_the_manifest():
+    state = {
+        "evidences": {
+            "repo": [_manifest("README.md", "src/graph.py", "rubric/rubric.json")],
+            "doc": [
+                _evidence(
+                    PDF_CITED_PATHS_GOAL,
+                    content="./src/graph.py\nrubric.json\nREADME.md",
+                )
+            ],
+        }
+    }
+    assert graph.evidence_aggregator(state) == {"evidence_count": 2}
+
+
+def test_aggregator_reports_hallucinated_paths():
+    state = {
+        "evidences": {
+            "repo": [
+                _manifest("src/graph.py"),
+                _evidence(
+                    "Verify required file exists: src/state.py",
+                    content="src/state.py",
+                    location="src/state.py",
+                ),
+            ],
+            "doc": [
+                _evidence(
+                    PDF_CITED_PATHS_GOAL,
+                    content="src/graph.py\nsrc/state.py\n\nsrc/zzz.py",
+                )
+            ],
+        }
+    }
+    result = graph.evidence_aggregator(state)
+    assert result["evidence_count"] == 4
+    (cross_ref,) = result["evidences"]["cross_ref"]
+    assert cross_ref.found is True
+    assert cross_ref.content == (
+        "Hallucinated paths: ['src/zzz.py']. "
+        "Verified: ['src/graph.py', 'src/state.py']"
+    )
+    assert "cited 3 paths" in cross_ref.rationale
@@ -0,0 +1,47 @@
+"""
+Unit tests for src/nodes/judges.py.
+
+Run from the repository root with ``pytest -q``.
+"""
+
+import json
+
+from src.nodes.judges import _extract_json_object
+
+
+# ---------------------------------------------------------------------------
+# Judge JSON recovery — _extract_json_object
+# ---------------------------------------------------------------------------
+
+
+def test_extract_json_object_plain():
+    text = '{"score": 4, "argument": "ok", "cited_evidence": []}'
+    assert _extract_json_object(text) == text
+
+
+def test_extract_json_object_nested_with_surrounding_prose():
+    obj = '{"score": 3, "meta": {"inner": {"x": 1}}, "cited_evidence": ["a"]}'
+    text = f"Here is my verdict:\n{obj}\nThanks."
+    assert _extract_json_object(text) == obj
+    assert json.loads(_extract_json_object(text))["meta"]["inner"]["x"] == 1
+
+
+def test_extract_json_object_braces_and_escapes_inside_strings():
+    obj = r'{"argument": "uses {braces} and \"quoted }\" text \\", "score": 2}'
+    span = _extract_json_object("Sure: " + obj)
+    assert span == obj
+    assert json.loads(span)["argument"] == 'uses {braces} and "quoted }" text \\'
+
+
+def test_extract_json_object_ignores_trailing_brace():
+    obj = '{"score": 5, "argument": "fine"}'
+    assert _extract_json_object(obj + " trailing } and more }") == obj
+
+
+def test_extract_json_object_returns_none_without_object():
+    assert _extract_json_object("no json here") is None
+    assert _extract_json_object("") is None
+
+
+def test_extract_json_object_returns_none_when_unbalanced():
+    assert _extract_json_object('{"score": 4, "argument": "cut off') is None
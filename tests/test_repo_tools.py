@@ -0,0 +1,77 @@
+"""
+Unit tests for src/tools/repo_tools.py.
+
+Run from the repository root with ``pytest -q``.
+"""
+
+import os
+import subprocess
+
+from src.tools.repo_tools import extract_git_history
+
+
+# ---------------------------------------------------------------------------
+# Git history parsing — extract_git_history (git log -z stream)
+# ---------------------------------------------------------------------------
+
+
+def _git(repo, *args, when="2024-01-01T10:00:00+00:00"):
+    env = {**os.environ, "GIT_AUTHOR_DATE": when, "GIT_COMMITTER_DATE": when}
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit(repo, message, when="2024-01-01T10:00:00+00:00"):
+    _git(
+        repo,
+        "commit",
+        "--allow-empty",
+        "--allow-empty-message",
+        "-m",
+        message,
+        when=when,
+    )
+
+
+def test_git_history_zero_commits(tmp_path):
+    _git(tmp_path, "init", "-q")
+    history = extract_git_history(str(tmp_path))
+    assert history["total_commits"] == 0
+    assert history["commits"] == []
+    assert history["bulk_upload_flag"] is False
+
+
+def test_git_history_keeps_awkward_subjects_in_order(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _commit(tmp_path, "init project setup", when="2024-01-01T10:00:00+00:00")
+    _commit(tmp_path, "judges|||with pipes", when="2024-01-02T10:00:00+00:00")
+    _commit(tmp_path, "", when="2024-01-03T10:00:00+00:00")
+    _commit(tmp_path, "build langgraph graph", when="2024-01-04T10:00:00+00:00")
+
+    history = extract_git_history(str(tmp_path))
+    assert history["total_commits"] == 4
+    assert [c["message"] for c in history["commits"]] == [
+        "init project setup",
+        "judges|||with pipes",
+        "",
+        "build langgraph graph",
+    ]
+    assert all(len(c["hash"]) == 40 for c in history["commits"])
+    assert history["commits"][0]["timestamp"].startswith("2024-01-01 10:00:00")
+    assert history["bulk_upload_flag"] is False
+    assert history["progression_detected"] is True
+
+
+def test_git_history_flags_bulk_upload(tmp_path):
+    _git(tmp_path, "init", "-q")
+    for minute in range(4):
+        _commit(tmp_path, f"commit {minute}", when=f"2024-01-01T10:0{minute}:00+00:00")
+
+    history = extract_git_history(str(tmp_path))
+    assert history["total_commits"] == 4
+    assert history["bulk_upload_flag"] is True